@@ -4,6 +4,7 @@ from functools import lru_cache
 
 class Settings(BaseSettings):
     database_url: str = "sqlite:///./forecheck.db"
+    database_read_url: str | None = None
     secret_key: str = "dev-secret-key-change-in-production"
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 60
@@ -26,6 +27,9 @@ class Settings(BaseSettings):
     nhl_game_center_delay_seconds: float = 0.25
     nhl_sync_commit_batch_size: int = 500
     nhl_player_on_demand_sync: bool = False
+    nhl_roster_use_static_teams: bool = False
+    nhl_stats_etag_cache_mb: int = 16
+    rolling_stats_workers: int = 1
 
     # Yahoo Fantasy API settings
     yahoo_enabled: bool = False
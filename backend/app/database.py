@@ -4,24 +4,41 @@ from sqlalchemy.orm import sessionmaker
 from app.config import get_settings
 
 settings = get_settings()
-database_url = settings.database_url.replace("postgres://", "postgresql://", 1)
-
-# Handle SQLite connection args
-connect_args = {}
-if database_url.startswith("sqlite"):
-    connect_args = {"check_same_thread": False}
-
-engine = create_engine(
-    database_url,
-    connect_args=connect_args,
-    pool_pre_ping=True,
-    pool_recycle=1800,
-)
+
+
+def _normalized_url(url: str) -> str:
+    return url.replace("postgres://", "postgresql://", 1)
+
+
+def _create_engine(url: str):
+    # Handle SQLite connection args
+    connect_args = {}
+    if url.startswith("sqlite"):
+        connect_args = {"check_same_thread": False}
+
+    return create_engine(
+        url,
+        connect_args=connect_args,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+    )
+
+
+database_url = _normalized_url(settings.database_url)
+engine = _create_engine(database_url)
+# Optional read replica for read-only bulk work such as the rolling-stats sweep.
+read_engine = _create_engine(_normalized_url(settings.database_read_url)) if settings.database_read_url else None
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
 
+def read_sessionmaker(primary_bind, replica: bool = True) -> sessionmaker:
+    """Session factory for read-only work: the read replica when configured and wanted, else ``primary_bind``."""
+    bind = read_engine if replica and read_engine is not None else primary_bind
+    return sessionmaker(autocommit=False, autoflush=False, bind=bind)
+
+
 def get_db():
     db = SessionLocal()
     try:
@@ -319,6 +319,11 @@ def _ensure_indexes(engine: Engine) -> None:
     inspector = inspect(engine)
     tables = set(inspector.get_table_names())
     with engine.begin() as connection:
+        if "users" in tables:
+            connection.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_users_refresh_token_hash "
+                "ON users (refresh_token_hash)"
+            ))
         if "player_game_stats" in tables:
             connection.execute(text(
                 "CREATE UNIQUE INDEX IF NOT EXISTS ux_player_game_stats_player_game "
@@ -23,7 +23,7 @@ class User(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
-    refresh_token_hash = Column(Text, nullable=True)
+    refresh_token_hash = Column(Text, nullable=True, index=True)
     refresh_token_expires_at = Column(DateTime, nullable=True)
     refresh_token_last_used_at = Column(DateTime, nullable=True)
 
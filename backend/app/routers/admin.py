@@ -16,6 +16,7 @@ from app.models.sync_state import SyncState
 from app.models.user import User
 from app.routers.auth import get_current_user
 from app.services.analytics import AnalyticsService
+from app.services.nhl_roster_api import invalidate_cache as invalidate_roster_cache
 from app.services.nhl_sync import (
     sync_all_game_logs,
     sync_game_center_full_backfill,
@@ -117,6 +118,7 @@ def _run_streamer_recalculation(run_id: str) -> None:
             score_config=score_config,
             progress_callback=on_progress,
             progress_every=20,
+            read_replica=True,
         )
         _set_sync_state(db, "rolling_stats")
 
@@ -315,6 +317,8 @@ def refresh_player_logs(
 
 @router.post("/sync/players")
 def sync_players_endpoint(db: Session = Depends(get_db), _: User = Depends(require_admin_user)):
+    # An explicit sync should see today's call-ups, not rosters cached by an earlier sweep.
+    invalidate_roster_cache()
     count = sync_players(db)
     _set_sync_state(db, "players")
     return {"status": "ok", "updated": count}
@@ -438,6 +442,7 @@ async def sync_ownership_endpoint(db: Session = Depends(get_db), _: User = Depen
 @router.post("/sync/pipeline")
 async def sync_pipeline_endpoint(db: Session = Depends(get_db), _: User = Depends(require_admin_user)):
 
+    invalidate_roster_cache()
     players_updated = sync_players(db)
     _set_sync_state(db, "players")
 
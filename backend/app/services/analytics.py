@@ -1,24 +1,299 @@
-from typing import Any, Callable, List, Optional
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from itertools import groupby
+import hashlib
+import json
 import logging
+import threading
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy.orm.attributes import manager_of_class
+from sqlalchemy import case, desc, func
 
+from app.config import get_settings
+from app.database import read_sessionmaker
 from app.models.player import Player, PlayerGameStats, PlayerRollingStats
 from app.services.season import current_season_id, current_game_type
 from app.services.streamer_score_config import (
-    get_default_streamer_score_config,
+    DEFAULT_STREAMER_SCORE_CONFIG,
     get_streamer_score_config,
 )
 
 
+_WINDOW_SIZES: dict[str, Optional[int]] = {
+    "L5": 5,
+    "L10": 10,
+    "L20": 20,
+    "Season": None,
+}
+_WINDOW_ITEMS: tuple[tuple[str, Optional[int]], ...] = tuple(_WINDOW_SIZES.items())
+
+# App setting holding the fingerprint of the score config and league context that
+# the last completed rolling stats sweep scored against.
+ROLLING_STATS_INPUTS_KEY = "rolling_stats_inputs"
+
+
+@dataclass(frozen=True)
+class LeagueFitPlan:
+    """League scoring terms and position caps resolved against one score config."""
+
+    is_points: bool
+    scoring_terms: tuple[tuple[str, float], ...]
+    cap_map: dict[str, float]
+    # (stat, weight, floored cap, lower_is_better) for category leagues.
+    category_terms: tuple[tuple[str, float, float, bool], ...] = ()
+    # (stat, weight, min value, max value, min points, max points) for points leagues.
+    points_terms: tuple[tuple[str, float, float, float, float, float], ...] = ()
+
+
+# Per-game rate components of the skater streamer score; hits+blocks stays last
+# so the toggle can drop it by truncation.
+_SKATER_RATE_STATS = (
+    "points_per_game",
+    "shots_per_game",
+    "power_play_points_per_game",
+    "time_on_ice_per_game",
+    "hits_blocks_per_game",
+)
+
+
+def _trend_bonuses(enabled: bool, hot_bonus: float, stable_bonus: float) -> dict[str, float]:
+    return {"hot": hot_bonus, "stable": stable_bonus} if enabled else {}
+
+
+@dataclass(frozen=True)
+class SkaterScoreParams:
+    """Skater streamer-score weights, caps and toggles resolved from one score config."""
+
+    # Parallel to _SKATER_RATE_STATS.
+    rate_caps: tuple[float, ...]
+    rate_weights: tuple[float, ...]
+    plus_minus_weight: float
+    trend_hot_bonus: float
+    trend_stable_bonus: float
+    availability_weight: float
+    toi_gate_floor: float
+    # Zero when the TOI gate is disabled or the cap does not exceed the floor.
+    toi_gate_range: float
+    use_hits_blocks: bool
+    use_plus_minus: bool
+    use_trend_bonus: bool
+    use_toi_gate: bool
+    use_availability_bonus: bool
+    # Trend direction -> bonus; empty when the trend bonus is disabled.
+    trend_bonuses: dict[str, float]
+
+    @classmethod
+    def from_config(cls, score_config: dict[str, Any], is_defense: bool) -> "SkaterScoreParams":
+        skater_cfg = score_config.get("skater", {})
+        weights = skater_cfg.get("weights", {})
+        caps = skater_cfg.get("caps", {}).get("defense" if is_defense else "forward", {})
+        toggles = skater_cfg.get("toggles", {})
+        toi_gate_cfg = skater_cfg.get("toi_gate", {})
+
+        rate_caps = tuple(float(caps.get(stat, 1.0)) for stat in _SKATER_RATE_STATS)
+        use_toi_gate = bool(toggles.get("use_toi_gate_for_availability", True))
+        toi_gate_floor = float(
+            toi_gate_cfg.get("defense_floor", 16.0)
+            if is_defense
+            else toi_gate_cfg.get("forward_floor", 14.0)
+        )
+        toi_gate_range = rate_caps[3] - toi_gate_floor if use_toi_gate else 0.0
+        trend_hot_bonus = float(weights.get("trend_hot_bonus", 0.0))
+        trend_stable_bonus = float(weights.get("trend_stable_bonus", 0.0))
+        use_trend_bonus = bool(toggles.get("use_trend_bonus", True))
+        return cls(
+            rate_caps=rate_caps,
+            rate_weights=tuple(float(weights.get(stat, 0.0)) for stat in _SKATER_RATE_STATS),
+            plus_minus_weight=float(weights.get("plus_minus_per_game", 0.0)),
+            trend_hot_bonus=trend_hot_bonus,
+            trend_stable_bonus=trend_stable_bonus,
+            availability_weight=float(weights.get("availability_bonus", 0.0)),
+            toi_gate_floor=toi_gate_floor,
+            toi_gate_range=max(toi_gate_range, 0.0),
+            use_hits_blocks=bool(toggles.get("use_hits_blocks", True)),
+            use_plus_minus=bool(toggles.get("use_plus_minus", True)),
+            use_trend_bonus=use_trend_bonus,
+            use_toi_gate=use_toi_gate,
+            use_availability_bonus=bool(toggles.get("use_availability_bonus", False)),
+            trend_bonuses=_trend_bonuses(use_trend_bonus, trend_hot_bonus, trend_stable_bonus),
+        )
+
+    def toi_gate(self, toi_pg: float) -> float:
+        if self.toi_gate_range > 0:
+            return max(0.0, min((toi_pg - self.toi_gate_floor) / self.toi_gate_range, 1.0))
+        return 1.0
+
+
+@dataclass(frozen=True)
+class GoalieScoreParams:
+    """Goalie streamer-score weights, scales and toggles resolved from one score config."""
+
+    save_percentage_weight: float
+    goals_against_average_weight: float
+    wins_weight: float
+    starts_weight: float
+    trend_hot_bonus: float
+    trend_stable_bonus: float
+    availability_weight: float
+    save_percentage_floor: float
+    # Ranges are floored at 0.0001 so they can always divide.
+    save_percentage_range: float
+    goals_against_average_ceiling: float
+    goals_against_average_range: float
+    # save_percentage_floor + save_percentage_range, shown as the breakdown cap.
+    save_percentage_cap: float
+    use_trend_bonus: bool
+    use_availability_bonus: bool
+    use_sample_penalty: bool
+    # Trend direction -> bonus; empty when the trend bonus is disabled.
+    trend_bonuses: dict[str, float]
+
+    @classmethod
+    def from_config(cls, score_config: dict[str, Any]) -> "GoalieScoreParams":
+        goalie_cfg = score_config.get("goalie", {})
+        weights = goalie_cfg.get("weights", {})
+        scales = goalie_cfg.get("scales", {})
+        toggles = goalie_cfg.get("toggles", {})
+        save_percentage_floor = float(scales.get("save_percentage_floor", 0.88))
+        save_percentage_range = max(float(scales.get("save_percentage_range", 0.05)), 0.0001)
+        trend_hot_bonus = float(weights.get("trend_hot_bonus", 0.0))
+        trend_stable_bonus = float(weights.get("trend_stable_bonus", 0.0))
+        use_trend_bonus = bool(toggles.get("use_trend_bonus", True))
+        return cls(
+            save_percentage_weight=float(weights.get("save_percentage", 0.0)),
+            goals_against_average_weight=float(weights.get("goals_against_average", 0.0)),
+            wins_weight=float(weights.get("wins", 0.0)),
+            starts_weight=float(weights.get("starts", 0.0)),
+            trend_hot_bonus=trend_hot_bonus,
+            trend_stable_bonus=trend_stable_bonus,
+            availability_weight=float(weights.get("availability_bonus", 0.0)),
+            save_percentage_floor=save_percentage_floor,
+            save_percentage_range=save_percentage_range,
+            goals_against_average_ceiling=float(scales.get("goals_against_average_ceiling", 3.5)),
+            goals_against_average_range=max(
+                float(scales.get("goals_against_average_range", 1.5)),
+                0.0001,
+            ),
+            save_percentage_cap=save_percentage_floor + save_percentage_range,
+            use_trend_bonus=use_trend_bonus,
+            use_availability_bonus=bool(toggles.get("use_availability_bonus", False)),
+            use_sample_penalty=bool(toggles.get("use_sample_penalty", True)),
+            trend_bonuses=_trend_bonuses(use_trend_bonus, trend_hot_bonus, trend_stable_bonus),
+        )
+
+
+@dataclass(frozen=True)
+class LeagueInfluenceParams:
+    """League-influence settings resolved from one score config."""
+
+    enabled: bool
+    # Clamped to [0, 1].
+    weight: float
+    minimum_games: int
+
+    @classmethod
+    def from_config(cls, score_config: dict[str, Any]) -> "LeagueInfluenceParams":
+        league_cfg = score_config.get("league_influence", {})
+        return cls(
+            enabled=bool(league_cfg.get("enabled", True)),
+            weight=max(0.0, min(float(league_cfg.get("weight", 0.35)), 1.0)),
+            minimum_games=int(max(0, float(league_cfg.get("minimum_games", 3)))),
+        )
+
+
+_ROLLING_STATS_MANAGER = manager_of_class(PlayerRollingStats)
+
+
+def _new_rolling_stats(**values: Any) -> PlayerRollingStats:
+    """Create a transient ``PlayerRollingStats`` without the declarative constructor.
+
+    The instance gets its ORM state but its column values are written straight
+    into ``__dict__``, skipping the per-keyword mapper checks and attribute
+    events. That is enough for ``Session.add`` (inserts read the instance dict)
+    and for reading the values back with ``_rolling_stats_values``.
+    """
+    stats = _ROLLING_STATS_MANAGER.new_instance()
+    stats.__dict__.update(values)
+    return stats
+
+
+def _rolling_stats_values(stats: PlayerRollingStats) -> dict[str, Any]:
+    """Column values set on a ``_new_rolling_stats`` instance, as a bulk-write mapping."""
+    values = stats.__dict__.copy()
+    del values["_sa_instance_state"]
+    return values
+
+
+# Resolved score params per role ("F", "D", "G") plus "league", tagged with the
+# config they came from.
+_SCORE_PARAMS: dict[str, tuple[dict[str, Any], Any]] = {}
+# League cap maps per role, tagged the same way.
+_LEAGUE_CAP_MAPS: dict[str, tuple[dict[str, Any], dict[str, float]]] = {}
+
+
+def _player_batches(players: Iterable[Player], batch_size: int) -> Iterator[list[Player]]:
+    batch: list[Player] = []
+    for player in players:
+        batch.append(player)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _scaled(value: float, cap: float, weight: float) -> float:
+    if cap <= 0:
+        return 0.0
+    return max(0.0, min(value / cap, 1.0)) * weight
+
+
+def _scaled_with_norm(value: float, cap: float, weight: float) -> tuple[float, float]:
+    if cap <= 0:
+        return 0.0, 0.0
+    normalized = max(0.0, min(value / cap, 1.0))
+    return normalized, normalized * weight
+
+
+@dataclass(slots=True)
+class ScoreComponent:
+    """One row of a streamer-score breakdown; base/final contributions are filled in afterwards."""
+
+    key: str
+    label: str
+    enabled: bool
+    metric_value: Optional[float] = None
+    cap: Optional[float] = None
+    weight: Optional[float] = None
+    normalized_value: Optional[float] = None
+    raw_contribution: float = 0.0
+    base_contribution: float = 0.0
+    final_contribution: float = 0.0
+    notes: Optional[str] = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "key": self.key,
+            "label": self.label,
+            "enabled": self.enabled,
+            "metric_value": self.metric_value,
+            "cap": self.cap,
+            "weight": self.weight,
+            "normalized_value": self.normalized_value,
+            "raw_contribution": self.raw_contribution,
+            "base_contribution": self.base_contribution,
+            "final_contribution": self.final_contribution,
+            "notes": self.notes,
+        }
+
+
 class AnalyticsService:
-    WINDOW_SIZES = {
-        "L5": 5,
-        "L10": 10,
-        "L20": 20,
-        "Season": None,
-    }
+    WINDOW_SIZES = _WINDOW_SIZES
+    # Players streamed per batch by update_all_rolling_stats; touched rows are
+    # flushed and released from the session at the same boundary.
+    ROLLING_UPDATE_BATCH_SIZE = 256
 
     logger = logging.getLogger(__name__)
     LEAGUE_STAT_ALIASES = {
@@ -69,6 +344,14 @@ class AnalyticsService:
         "goalie_starts": "starts",
         "goalie_games_started": "starts",
     }
+    # Common spellings of the alias keys (as typed or as Yahoo reports them),
+    # so most lookups skip the strip/lower/replace normalization entirely.
+    LEAGUE_STAT_ALIASES_FAST = {
+        variant: stat
+        for alias, stat in LEAGUE_STAT_ALIASES.items()
+        for spaced in (alias, alias.replace("_", " "))
+        for variant in (spaced, spaced.upper(), spaced.title())
+    }
     LEAGUE_LOWER_BETTER_STATS = {"goals_against_average", "goals_against"}
     LEAGUE_MIN_VALUES = {
         "plus_minus": -2.0,
@@ -88,6 +371,50 @@ class AnalyticsService:
         "shorthanded_points": 0.2,
         "time_on_ice": 25.0,
     }
+    FORWARD_TREND_WEIGHTS = {
+        "ppg": 0.30,
+        "gpg": 0.20,
+        "apg": 0.10,
+        "spg": 0.15,
+        "toi": 0.15,
+        "pppg": 0.05,
+        "hits_blocks": 0.05,
+    }
+    DEFENSE_TREND_WEIGHTS = {
+        "pppg": 0.25,
+        "ppg": 0.20,
+        "spg": 0.15,
+        "toi": 0.20,
+        "apg": 0.05,
+        "gpg": 0.05,
+        "blocks": 0.10,
+    }
+    # Game-log columns read by the skater/goalie aggregations and trend scoring.
+    SKATER_GAME_COLUMNS = (
+        "player_id",
+        "date",
+        "goals",
+        "assists",
+        "points",
+        "shots",
+        "hits",
+        "blocks",
+        "plus_minus",
+        "pim",
+        "power_play_points",
+        "shorthanded_points",
+        "time_on_ice",
+    )
+    GOALIE_GAME_COLUMNS = (
+        "player_id",
+        "date",
+        "time_on_ice",
+        "saves",
+        "shots_against",
+        "goals_against",
+        "wins",
+        "shutouts",
+    )
     LEAGUE_GOALIE_CAP_DEFAULTS = {
         "wins": 1.0,
         "save_percentage": 0.94,
@@ -108,16 +435,324 @@ class AnalyticsService:
         game_type: Optional[int] = None,
         score_config: Optional[dict] = None,
         league_context: Optional[dict[str, Any]] = None,
+        computed_at: Optional[datetime] = None,
     ) -> PlayerRollingStats:
         """Compute rolling statistics for a player."""
         season_id = season_id or current_season_id()
         game_type = game_type if game_type is not None else current_game_type()
         score_config = score_config or get_streamer_score_config(db)
-        window_size = AnalyticsService.WINDOW_SIZES.get(window)
+        computed_at = computed_at or datetime.utcnow()
+        window_size = _WINDOW_SIZES.get(window)
 
         # Get game stats sorted by date
-        query = (
-            db.query(PlayerGameStats)
+        query = AnalyticsService._player_games_query(db, player, season_id, game_type)
+
+        if window_size:
+            game_stats = query.limit(window_size).all()
+        else:
+            game_stats = query.all()
+
+        trend_games = query.limit(20).all()
+        return AnalyticsService._rolling_stats_from_games(
+            player,
+            game_stats,
+            trend_games,
+            window,
+            window_size,
+            season_id,
+            game_type,
+            score_config,
+            league_context=league_context,
+            computed_at=computed_at,
+        )
+
+    @staticmethod
+    def compute_rolling_stats_multi(
+        db: Session,
+        player: Player,
+        windows: Optional[Iterable[str]] = None,
+        season_id: Optional[str] = None,
+        game_type: Optional[int] = None,
+        score_config: Optional[dict] = None,
+        league_context: Optional[dict[str, Any]] = None,
+        computed_at: Optional[datetime] = None,
+    ) -> dict[str, PlayerRollingStats]:
+        """Compute rolling statistics for several windows of one player from a single game-log fetch."""
+        season_id = season_id or current_season_id()
+        game_type = game_type if game_type is not None else current_game_type()
+        score_config = score_config or get_streamer_score_config(db)
+        computed_at = computed_at or datetime.utcnow()
+        if windows is None:
+            window_items = _WINDOW_ITEMS
+        else:
+            window_items = tuple((window, _WINDOW_SIZES.get(window)) for window in windows)
+
+        query = AnalyticsService._player_games_query(db, player, season_id, game_type)
+        game_limit = AnalyticsService._window_game_limit(window_items)
+        if game_limit:
+            query = query.limit(game_limit)
+
+        return AnalyticsService._window_stats_from_games(
+            player,
+            query.all(),
+            window_items,
+            season_id,
+            game_type,
+            score_config,
+            league_context=league_context,
+            computed_at=computed_at,
+        )
+
+    @staticmethod
+    def compute_rolling_stats_multi_batch(
+        db: Session,
+        players: Iterable[Player],
+        windows: Optional[Iterable[str]] = None,
+        season_id: Optional[str] = None,
+        game_type: Optional[int] = None,
+        score_config: Optional[dict] = None,
+        league_context: Optional[dict[str, Any]] = None,
+        computed_at: Optional[datetime] = None,
+    ) -> dict[str, dict[str, PlayerRollingStats]]:
+        """Compute rolling statistics for several windows of many players with a single game-log query."""
+        season_id = season_id or current_season_id()
+        game_type = game_type if game_type is not None else current_game_type()
+        score_config = score_config or get_streamer_score_config(db)
+        computed_at = computed_at or datetime.utcnow()
+        if windows is None:
+            window_items = _WINDOW_ITEMS
+        else:
+            window_items = tuple((window, _WINDOW_SIZES.get(window)) for window in windows)
+        players_by_id = {player.id: player for player in players}
+        if not players_by_id:
+            return {}
+
+        game_limit = AnalyticsService._window_game_limit(window_items)
+        season_totals: dict[str, tuple[int, tuple]] = {}
+        if game_limit is None:
+            # Sum the season in the database and only fetch the games the other windows and trend need.
+            season_totals = AnalyticsService._player_season_totals(
+                db, players_by_id.values(), season_id, game_type
+            )
+            game_limit = AnalyticsService._window_game_limit(
+                tuple(item for item in window_items if item[1])
+            )
+        games_by_player = AnalyticsService._player_games_by_id(
+            db,
+            players_by_id.values(),
+            season_id,
+            game_type,
+            game_limit,
+        )
+        return {
+            player_id: AnalyticsService._window_stats_from_games(
+                player,
+                games_by_player.get(player_id, []),
+                window_items,
+                season_id,
+                game_type,
+                score_config,
+                league_context=league_context,
+                computed_at=computed_at,
+                season_totals=season_totals.get(player_id),
+            )
+            for player_id, player in players_by_id.items()
+        }
+
+    @staticmethod
+    def _window_game_limit(window_items: tuple[tuple[str, Optional[int]], ...]) -> Optional[int]:
+        """Newest games the windows and the L20 trend need, or None when any window takes the season."""
+        window_sizes = [window_size for _, window_size in window_items]
+        if all(window_sizes):
+            return max(window_sizes + [20])
+        return None
+
+    @staticmethod
+    def _window_stats_from_games(
+        player: Player,
+        games: List[PlayerGameStats],
+        window_items: tuple[tuple[str, Optional[int]], ...],
+        season_id: str,
+        game_type: int,
+        score_config: dict,
+        league_context: Optional[dict[str, Any]] = None,
+        computed_at: Optional[datetime] = None,
+        season_totals: Optional[tuple[int, tuple]] = None,
+    ) -> dict[str, PlayerRollingStats]:
+        """Stats for every window from the player's newest-first games.
+
+        When ``season_totals`` (games played and window totals) is given, the
+        season window uses it and ``games`` only needs to cover the other windows.
+        """
+        trend_games = games[:20]
+        # The trend only looks at the newest 20 games, so every window shares it.
+        trend = AnalyticsService._calculate_trend(trend_games, player.position) if games else None
+        window_totals_fn = (
+            AnalyticsService._goalie_window_totals
+            if player.position == "G"
+            else AnalyticsService._skater_window_totals
+        )
+        window_totals = window_totals_fn(games, (window_size for _, window_size in window_items))
+        season_games_played = None
+        if season_totals is not None:
+            season_games_played, window_totals[None] = season_totals
+        return {
+            window: AnalyticsService._rolling_stats_from_games(
+                player,
+                games[:window_size] if window_size else games,
+                trend_games,
+                window,
+                window_size,
+                season_id,
+                game_type,
+                score_config,
+                league_context=league_context,
+                computed_at=computed_at,
+                trend=trend,
+                totals=window_totals[window_size],
+                games_played=None if window_size else season_games_played,
+            )
+            for window, window_size in window_items
+        }
+
+    @staticmethod
+    def compute_rolling_stats_batch(
+        db: Session,
+        players: Iterable[Player],
+        window: str = "L10",
+        season_id: Optional[str] = None,
+        game_type: Optional[int] = None,
+        score_config: Optional[dict] = None,
+        league_context: Optional[dict[str, Any]] = None,
+        computed_at: Optional[datetime] = None,
+    ) -> dict[str, PlayerRollingStats]:
+        """Compute one window's rolling statistics for many players; see ``compute_rolling_stats_multi_batch``."""
+        stats_by_player = AnalyticsService.compute_rolling_stats_multi_batch(
+            db,
+            players,
+            windows=(window,),
+            season_id=season_id,
+            game_type=game_type,
+            score_config=score_config,
+            league_context=league_context,
+            computed_at=computed_at,
+        )
+        return {player_id: window_stats[window] for player_id, window_stats in stats_by_player.items()}
+
+    @staticmethod
+    def _player_games_by_id(
+        db: Session,
+        players: Iterable[Player],
+        season_id: str,
+        game_type: int,
+        limit: Optional[int] = None,
+    ) -> dict[str, list]:
+        """Newest-first game-log rows for each player id, fetched in one query."""
+        players = list(players)
+        positions = {player.position for player in players}
+
+        filters = (
+            PlayerGameStats.player_id.in_([player.id for player in players]),
+            PlayerGameStats.season_id == season_id,
+            PlayerGameStats.game_type == game_type,
+        )
+        column_names = AnalyticsService._game_column_names(positions)
+        if limit:
+            # Rank each player's games newest-first and keep only the newest ``limit``.
+            ranked = (
+                db.query(
+                    *(getattr(PlayerGameStats, name) for name in column_names),
+                    func.row_number()
+                    .over(
+                        partition_by=PlayerGameStats.player_id,
+                        order_by=desc(PlayerGameStats.date),
+                    )
+                    .label("rn"),
+                )
+                .filter(*filters)
+                .subquery()
+            )
+            rows = (
+                db.query(*(ranked.c[name] for name in column_names))
+                .filter(ranked.c.rn <= limit)
+                .order_by(ranked.c.player_id, desc(ranked.c.date))
+                .all()
+            )
+        else:
+            rows = (
+                db.query(*(getattr(PlayerGameStats, name) for name in column_names))
+                .filter(*filters)
+                .order_by(PlayerGameStats.player_id, desc(PlayerGameStats.date))
+                .all()
+            )
+
+        return {
+            player_id: list(games)
+            for player_id, games in groupby(rows, key=lambda g: g.player_id)
+        }
+
+    @staticmethod
+    def _player_season_totals(
+        db: Session,
+        players: Iterable[Player],
+        season_id: str,
+        game_type: int,
+    ) -> dict[str, tuple[int, tuple]]:
+        """Season games played and window totals for each player id, summed in one grouped query.
+
+        The totals match ``_skater_window_totals`` / ``_goalie_window_totals`` for
+        the player's position, so they can stand in for the season window.
+        """
+        players = list(players)
+        goalie_ids = {player.id for player in players if player.position == "G"}
+
+        def total(column) -> Any:
+            return func.coalesce(func.sum(column), 0)
+
+        toi = func.coalesce(PlayerGameStats.time_on_ice, 0)
+        played = toi > 0
+
+        def goalie_total(column) -> Any:
+            return total(case((played, func.coalesce(column, 0)), else_=0))
+
+        # Skater sums follow SKATER_GAME_COLUMNS after player_id and date, the order of the skater totals.
+        skater_columns = AnalyticsService.SKATER_GAME_COLUMNS[2:]
+        rows = (
+            db.query(
+                PlayerGameStats.player_id,
+                func.count(),
+                *(total(getattr(PlayerGameStats, name)) for name in skater_columns),
+                total(case((played, 1), else_=0)),
+                total(case((toi >= 2400, 1), else_=0)),
+                goalie_total(PlayerGameStats.saves),
+                goalie_total(PlayerGameStats.shots_against),
+                goalie_total(PlayerGameStats.goals_against),
+                goalie_total(PlayerGameStats.wins),
+                goalie_total(PlayerGameStats.shutouts),
+            )
+            .filter(
+                PlayerGameStats.player_id.in_([player.id for player in players]),
+                PlayerGameStats.season_id == season_id,
+                PlayerGameStats.game_type == game_type,
+            )
+            .group_by(PlayerGameStats.player_id)
+            .all()
+        )
+        skater_end = 2 + len(skater_columns)
+        return {
+            row[0]: (row[1], tuple(row[skater_end:] if row[0] in goalie_ids else row[2:skater_end]))
+            for row in rows
+        }
+
+    @staticmethod
+    def _player_games_query(db: Session, player: Player, season_id: str, game_type: int):
+        return (
+            db.query(
+                *(
+                    getattr(PlayerGameStats, name)
+                    for name in AnalyticsService._game_column_names([player.position])
+                )
+            )
             .filter(
                 PlayerGameStats.player_id == player.id,
                 PlayerGameStats.season_id == season_id,
@@ -126,16 +761,35 @@ class AnalyticsService:
             .order_by(desc(PlayerGameStats.date))
         )
 
-        if window_size:
-            game_stats = query.limit(window_size).all()
-        else:
-            game_stats = query.all()
-
-        trend_games = query.limit(20).all()
-        games_played = len(game_stats)
+    @staticmethod
+    def _game_column_names(positions: Iterable[str]) -> list[str]:
+        """Game-log columns the given positions need, selected as plain rows rather than ORM objects."""
+        names: set[str] = set()
+        for position in positions:
+            if position == "G":
+                names.update(AnalyticsService.GOALIE_GAME_COLUMNS)
+            else:
+                names.update(AnalyticsService.SKATER_GAME_COLUMNS)
+        return sorted(names)
 
-        if games_played == 0:
-            return AnalyticsService._empty_rolling_stats(player.id, window, season_id, game_type)
+    @staticmethod
+    def _rolling_stats_from_games(
+        player: Player,
+        game_stats: List[PlayerGameStats],
+        trend_games: List[PlayerGameStats],
+        window: str,
+        window_size: Optional[int],
+        season_id: str,
+        game_type: int,
+        score_config: dict,
+        league_context: Optional[dict[str, Any]] = None,
+        computed_at: Optional[datetime] = None,
+        trend: Optional[str] = None,
+        totals: Optional[tuple] = None,
+        games_played: Optional[int] = None,
+    ) -> PlayerRollingStats:
+        if not game_stats:
+            return AnalyticsService._empty_rolling_stats(player.id, window, season_id, game_type, computed_at)
 
         # Check if goalie
         is_goalie = player.position == "G"
@@ -146,10 +800,14 @@ class AnalyticsService:
                 game_stats,
                 trend_games,
                 window,
+                window_size,
                 season_id,
                 game_type,
                 score_config,
                 league_context=league_context,
+                computed_at=computed_at,
+                trend=trend,
+                totals=totals,
             )
         else:
             return AnalyticsService._compute_skater_stats(
@@ -157,10 +815,15 @@ class AnalyticsService:
                 game_stats,
                 trend_games,
                 window,
+                window_size,
                 season_id,
                 game_type,
                 score_config,
                 league_context=league_context,
+                computed_at=computed_at,
+                trend=trend,
+                totals=totals,
+                games_played=games_played,
             )
 
     @staticmethod
@@ -169,26 +832,35 @@ class AnalyticsService:
         game_stats: List[PlayerGameStats],
         trend_games: List[PlayerGameStats],
         window: str,
+        window_size: Optional[int],
         season_id: str,
         game_type: int,
         score_config: dict,
         league_context: Optional[dict[str, Any]] = None,
+        computed_at: Optional[datetime] = None,
+        trend: Optional[str] = None,
+        totals: Optional[tuple] = None,
+        games_played: Optional[int] = None,
     ) -> PlayerRollingStats:
-        gp = len(game_stats)
+        gp = games_played if games_played is not None else len(game_stats)
         gp_float = float(gp)
 
-        # Calculate totals
-        total_goals = sum(g.goals for g in game_stats)
-        total_assists = sum(g.assists for g in game_stats)
-        total_points = sum(g.points for g in game_stats)
-        total_shots = sum(g.shots for g in game_stats)
-        total_hits = sum(g.hits for g in game_stats)
-        total_blocks = sum(g.blocks for g in game_stats)
-        total_plus_minus = sum(g.plus_minus for g in game_stats)
-        total_pim = sum(g.pim for g in game_stats)
-        total_ppp = sum(g.power_play_points for g in game_stats)
-        total_shp = sum(g.shorthanded_points for g in game_stats)
-        total_toi = sum(g.time_on_ice for g in game_stats)
+        # Calculate totals unless the caller already did for this window
+        if totals is None:
+            totals = AnalyticsService._skater_window_totals(game_stats, (None,))[None]
+        (
+            total_goals,
+            total_assists,
+            total_points,
+            total_shots,
+            total_hits,
+            total_blocks,
+            total_plus_minus,
+            total_pim,
+            total_ppp,
+            total_shp,
+            total_toi,
+        ) = totals
 
         # Calculate per-game averages
         goals_pg = total_goals / gp_float
@@ -203,8 +875,9 @@ class AnalyticsService:
         shp_pg = total_shp / gp_float
         toi_pg = (total_toi / gp_float) / 60.0  # Convert to minutes
 
-        # Calculate trend
-        trend = AnalyticsService._calculate_trend(trend_games, player.position)
+        # Calculate trend unless the caller already did for this player
+        if trend is None:
+            trend = AnalyticsService._calculate_trend(trend_games, player.position)
         temperature_tag = AnalyticsService._calculate_temperature_tag(
             player.position,
             window,
@@ -229,39 +902,42 @@ class AnalyticsService:
             ownership=player.ownership_percentage,
             score_config=score_config,
         )
-        streamer_score = AnalyticsService._apply_league_influence(
-            base_streamer_score=base_streamer_score,
-            score_config=score_config,
-            league_context=league_context,
-            games_played=gp,
-            player_position=player.position,
-            metrics={
-                "goals": goals_pg,
-                "assists": assists_pg,
-                "points": points_pg,
-                "shots": shots_pg,
-                "hits": hits_pg,
-                "blocks": blocks_pg,
-                "plus_minus": pm_pg,
-                "pim": pim_pg,
-                "power_play_points": ppp_pg,
-                "shorthanded_points": shp_pg,
-                "time_on_ice": toi_pg,
-            },
-        )
+        streamer_score = base_streamer_score
+        blend_weight = AnalyticsService._league_blend_weight(score_config, league_context, gp)
+        if blend_weight > 0:
+            streamer_score = AnalyticsService._apply_league_influence(
+                base_streamer_score=base_streamer_score,
+                score_config=score_config,
+                league_context=league_context,
+                blend_weight=blend_weight,
+                player_position=player.position,
+                metrics={
+                    "goals": goals_pg,
+                    "assists": assists_pg,
+                    "points": points_pg,
+                    "shots": shots_pg,
+                    "hits": hits_pg,
+                    "blocks": blocks_pg,
+                    "plus_minus": pm_pg,
+                    "pim": pim_pg,
+                    "power_play_points": ppp_pg,
+                    "shorthanded_points": shp_pg,
+                    "time_on_ice": toi_pg,
+                },
+            )
 
         # Check if rolling stats exist, update or create
         existing = None  # Would query from DB in real implementation
 
-        stats = PlayerRollingStats(
+        stats = _new_rolling_stats(
             player_id=player.id,
             window=window,
             season_id=season_id,
             game_type=game_type,
-            window_size=AnalyticsService.WINDOW_SIZES.get(window),
+            window_size=window_size,
             games_played=gp,
             goalie_games_started=0,
-            computed_at=datetime.utcnow(),
+            computed_at=computed_at or datetime.utcnow(),
             last_game_date=game_stats[0].date if game_stats else None,
             goals_per_game=goals_pg,
             assists_per_game=assists_pg,
@@ -297,25 +973,32 @@ class AnalyticsService:
         game_stats: List[PlayerGameStats],
         trend_games: List[PlayerGameStats],
         window: str,
+        window_size: Optional[int],
         season_id: str,
         game_type: int,
         score_config: dict,
         league_context: Optional[dict[str, Any]] = None,
+        computed_at: Optional[datetime] = None,
+        trend: Optional[str] = None,
+        totals: Optional[tuple] = None,
     ) -> PlayerRollingStats:
-        played_games = [g for g in game_stats if (g.time_on_ice or 0) > 0]
-        games_played = len(played_games)
-        games_started = sum(1 for g in game_stats if (g.time_on_ice or 0) >= 2400)
-
-        total_saves = sum(g.saves or 0 for g in played_games)
-        total_shots_against = sum(g.shots_against or 0 for g in played_games)
-        total_goals_against = sum(g.goals_against or 0 for g in played_games)
-        total_wins = sum(g.wins or 0 for g in played_games)
-        total_shutouts = sum(g.shutouts or 0 for g in played_games)
+        if totals is None:
+            totals = AnalyticsService._goalie_window_totals(game_stats, (None,))[None]
+        (
+            games_played,
+            games_started,
+            total_saves,
+            total_shots_against,
+            total_goals_against,
+            total_wins,
+            total_shutouts,
+        ) = totals
 
         sv_pct = total_saves / total_shots_against if total_shots_against > 0 else 0
         gaa = total_goals_against / games_played if games_played > 0 else 0
 
-        trend = AnalyticsService._calculate_trend(trend_games, player.position)
+        if trend is None:
+            trend = AnalyticsService._calculate_trend(trend_games, player.position)
         temperature_tag = AnalyticsService._calculate_temperature_tag(
             player.position,
             window,
@@ -323,7 +1006,7 @@ class AnalyticsService:
             save_percentage=sv_pct,
             games_started=games_started,
         )
-        expected_games = AnalyticsService.WINDOW_SIZES.get(window) or games_played
+        expected_games = window_size or games_played
         base_streamer_score = AnalyticsService._calculate_goalie_streamer_score(
             sv_pct,
             gaa,
@@ -335,33 +1018,36 @@ class AnalyticsService:
             player.ownership_percentage,
             score_config=score_config,
         )
-        streamer_score = AnalyticsService._apply_league_influence(
-            base_streamer_score=base_streamer_score,
-            score_config=score_config,
-            league_context=league_context,
-            games_played=games_played,
-            player_position=player.position,
-            metrics={
-                "wins": (total_wins / games_played) if games_played > 0 else 0.0,
-                "save_percentage": sv_pct,
-                "goals_against_average": gaa,
-                "saves": (total_saves / games_played) if games_played > 0 else 0.0,
-                "shots_against": (total_shots_against / games_played) if games_played > 0 else 0.0,
-                "goals_against": (total_goals_against / games_played) if games_played > 0 else 0.0,
-                "shutouts": (total_shutouts / games_played) if games_played > 0 else 0.0,
-                "starts": (games_started / games_played) if games_played > 0 else 0.0,
-            },
-        )
+        streamer_score = base_streamer_score
+        blend_weight = AnalyticsService._league_blend_weight(score_config, league_context, games_played)
+        if blend_weight > 0:
+            streamer_score = AnalyticsService._apply_league_influence(
+                base_streamer_score=base_streamer_score,
+                score_config=score_config,
+                league_context=league_context,
+                blend_weight=blend_weight,
+                player_position=player.position,
+                metrics={
+                    "wins": (total_wins / games_played) if games_played > 0 else 0.0,
+                    "save_percentage": sv_pct,
+                    "goals_against_average": gaa,
+                    "saves": (total_saves / games_played) if games_played > 0 else 0.0,
+                    "shots_against": (total_shots_against / games_played) if games_played > 0 else 0.0,
+                    "goals_against": (total_goals_against / games_played) if games_played > 0 else 0.0,
+                    "shutouts": (total_shutouts / games_played) if games_played > 0 else 0.0,
+                    "starts": (games_started / games_played) if games_played > 0 else 0.0,
+                },
+            )
 
-        stats = PlayerRollingStats(
+        stats = _new_rolling_stats(
             player_id=player.id,
             window=window,
             season_id=season_id,
             game_type=game_type,
-            window_size=AnalyticsService.WINDOW_SIZES.get(window),
+            window_size=window_size,
             games_played=games_played,
             goalie_games_started=games_started,
-            computed_at=datetime.utcnow(),
+            computed_at=computed_at or datetime.utcnow(),
             last_game_date=game_stats[0].date if game_stats else None,
             save_percentage=sv_pct,
             goals_against_average=gaa,
@@ -377,15 +1063,78 @@ class AnalyticsService:
 
         return stats
 
+    @staticmethod
+    def _skater_window_totals(
+        games: List[PlayerGameStats],
+        window_sizes: Iterable[Optional[int]],
+    ) -> dict[Optional[int], tuple]:
+        """Skater totals for each window size (None for every game) from one running pass.
+
+        Windows are newest-first prefixes of ``games``, so each window's totals
+        are the running totals captured once that many games have been added.
+        """
+        window_sizes = tuple(window_sizes)
+        stops = {size for size in window_sizes if size and size < len(games)}
+        totals: dict[Optional[int], tuple] = {}
+        goals = assists = points = shots = hits = blocks = 0
+        plus_minus = pim = ppp = shp = toi = 0
+        for count, g in enumerate(games, start=1):
+            goals += g.goals
+            assists += g.assists
+            points += g.points
+            shots += g.shots
+            hits += g.hits
+            blocks += g.blocks
+            plus_minus += g.plus_minus
+            pim += g.pim
+            ppp += g.power_play_points
+            shp += g.shorthanded_points
+            toi += g.time_on_ice
+            if count in stops:
+                totals[count] = (goals, assists, points, shots, hits, blocks, plus_minus, pim, ppp, shp, toi)
+        all_games = (goals, assists, points, shots, hits, blocks, plus_minus, pim, ppp, shp, toi)
+        for size in window_sizes:
+            totals.setdefault(size, all_games)
+        return totals
+
+    @staticmethod
+    def _goalie_window_totals(
+        games: List[PlayerGameStats],
+        window_sizes: Iterable[Optional[int]],
+    ) -> dict[Optional[int], tuple]:
+        """Goalie totals for each window size (None for every game) from one running pass.
+
+        Games without ice time still count towards a window's size but add nothing.
+        """
+        window_sizes = tuple(window_sizes)
+        stops = {size for size in window_sizes if size and size < len(games)}
+        totals: dict[Optional[int], tuple] = {}
+        played = started = saves = shots_against = goals_against = wins = shutouts = 0
+        for count, g in enumerate(games, start=1):
+            toi = g.time_on_ice or 0
+            if toi > 0:
+                played += 1
+                started += toi >= 2400
+                saves += g.saves or 0
+                shots_against += g.shots_against or 0
+                goals_against += g.goals_against or 0
+                wins += g.wins or 0
+                shutouts += g.shutouts or 0
+            if count in stops:
+                totals[count] = (played, started, saves, shots_against, goals_against, wins, shutouts)
+        all_games = (played, started, saves, shots_against, goals_against, wins, shutouts)
+        for size in window_sizes:
+            totals.setdefault(size, all_games)
+        return totals
+
     @staticmethod
     def _calculate_trend(game_stats: List[PlayerGameStats], position: str) -> str:
-        if len(game_stats) < 5:
+        # A trend needs at least 10 games of baseline to compare the last 5 against.
+        if len(game_stats) < 10:
             return "stable"
 
         recent_games = game_stats[:5]
         window_games = game_stats[:20]
-        if len(window_games) < 10:
-            return "stable"
 
         if position == "G":
             trend_score = AnalyticsService._goalie_trend_score(recent_games, window_games)
@@ -404,30 +1153,34 @@ class AnalyticsService:
         window_games: List[PlayerGameStats],
         position: str,
     ) -> float:
-        def per_game(games, getter):
-            return sum(getter(g) for g in games) / len(games)
-
         def delta(recent, baseline, floor):
             denom = max(abs(baseline), floor)
             return (recent - baseline) / denom
 
-        recent_ppg = per_game(recent_games, lambda g: g.points)
-        recent_gpg = per_game(recent_games, lambda g: g.goals)
-        recent_apg = per_game(recent_games, lambda g: g.assists)
-        recent_spg = per_game(recent_games, lambda g: g.shots)
-        recent_pppg = per_game(recent_games, lambda g: g.power_play_points)
-        recent_toi = per_game(recent_games, lambda g: (g.time_on_ice or 0) / 60.0)
-        recent_hits = per_game(recent_games, lambda g: g.hits)
-        recent_blocks = per_game(recent_games, lambda g: g.blocks)
-
-        window_ppg = per_game(window_games, lambda g: g.points)
-        window_gpg = per_game(window_games, lambda g: g.goals)
-        window_apg = per_game(window_games, lambda g: g.assists)
-        window_spg = per_game(window_games, lambda g: g.shots)
-        window_pppg = per_game(window_games, lambda g: g.power_play_points)
-        window_toi = per_game(window_games, lambda g: (g.time_on_ice or 0) / 60.0)
-        window_hits = per_game(window_games, lambda g: g.hits)
-        window_blocks = per_game(window_games, lambda g: g.blocks)
+        recent_averages, window_averages = AnalyticsService._skater_trend_averages(
+            window_games,
+            len(recent_games),
+        )
+        (
+            recent_ppg,
+            recent_gpg,
+            recent_apg,
+            recent_spg,
+            recent_pppg,
+            recent_toi,
+            recent_hits,
+            recent_blocks,
+        ) = recent_averages
+        (
+            window_ppg,
+            window_gpg,
+            window_apg,
+            window_spg,
+            window_pppg,
+            window_toi,
+            window_hits,
+            window_blocks,
+        ) = window_averages
 
         d_ppg = delta(recent_ppg, window_ppg, 0.5)
         d_gpg = delta(recent_gpg, window_gpg, 0.3)
@@ -439,15 +1192,7 @@ class AnalyticsService:
         d_hits_blocks = delta((recent_hits + recent_blocks) / 2, (window_hits + window_blocks) / 2, 1.0)
 
         if position == "D":
-            weights = {
-                "pppg": 0.25,
-                "ppg": 0.20,
-                "spg": 0.15,
-                "toi": 0.20,
-                "apg": 0.05,
-                "gpg": 0.05,
-                "blocks": 0.10,
-            }
+            weights = AnalyticsService.DEFENSE_TREND_WEIGHTS
             return (
                 d_pppg * weights["pppg"]
                 + d_ppg * weights["ppg"]
@@ -458,15 +1203,7 @@ class AnalyticsService:
                 + d_blocks * weights["blocks"]
             )
 
-        weights = {
-            "ppg": 0.30,
-            "gpg": 0.20,
-            "apg": 0.10,
-            "spg": 0.15,
-            "toi": 0.15,
-            "pppg": 0.05,
-            "hits_blocks": 0.05,
-        }
+        weights = AnalyticsService.FORWARD_TREND_WEIGHTS
         return (
             d_ppg * weights["ppg"]
             + d_gpg * weights["gpg"]
@@ -477,6 +1214,40 @@ class AnalyticsService:
             + d_hits_blocks * weights["hits_blocks"]
         )
 
+    @staticmethod
+    def _skater_trend_averages(
+        games: List[PlayerGameStats],
+        recent_count: int,
+    ) -> tuple[tuple[float, ...], tuple[float, ...]]:
+        """Per-game averages for the newest ``recent_count`` games and for all ``games``.
+
+        The recent slice is a prefix of the window, so both are read off one pass
+        and each row (including its TOI-to-minutes conversion) is visited once.
+        """
+        points = goals = assists = shots = ppp = toi = hits = blocks = 0
+        recent_totals = None
+        for idx, g in enumerate(games):
+            if idx == recent_count:
+                recent_totals = (points, goals, assists, shots, ppp, toi, hits, blocks)
+            points += g.points
+            goals += g.goals
+            assists += g.assists
+            shots += g.shots
+            ppp += g.power_play_points
+            toi += (g.time_on_ice or 0) / 60.0
+            hits += g.hits
+            blocks += g.blocks
+        window_totals = (points, goals, assists, shots, ppp, toi, hits, blocks)
+        if recent_totals is None:
+            recent_totals = window_totals
+
+        recent_gp = min(recent_count, len(games))
+        window_gp = len(games)
+        return (
+            tuple(total / recent_gp for total in recent_totals),
+            tuple(total / window_gp for total in window_totals),
+        )
+
     @staticmethod
     def _goalie_trend_score(
         recent_games: List[PlayerGameStats],
@@ -487,24 +1258,9 @@ class AnalyticsService:
         hot_gaa_ceiling = 3.0
         cold_gaa_floor = 3.2
 
-        def goalie_slice(games):
-            played = [g for g in games if (g.time_on_ice or 0) > 0]
-            gp = len(played)
-            if gp == 0:
-                return 0.0, 0.0, 0.0, 0.0
-            saves = sum(g.saves or 0 for g in played)
-            shots = sum(g.shots_against or 0 for g in played)
-            goals = sum(g.goals_against or 0 for g in played)
-            wins = sum(g.wins or 0 for g in played)
-            sv_pct = saves / shots if shots > 0 else 0.0
-            gaa = goals / gp
-            win_rate = wins / gp
-            starts = sum(1 for g in played if (g.time_on_ice or 0) >= 2400)
-            start_rate = starts / gp
-            return sv_pct, gaa, win_rate, start_rate
-
-        recent_sv, recent_gaa, recent_wr, recent_sr = goalie_slice(recent_games)
-        window_sv, window_gaa, window_wr, window_sr = goalie_slice(window_games)
+        (recent_sv, recent_gaa, recent_wr, recent_sr), (window_sv, window_gaa, window_wr, window_sr) = (
+            AnalyticsService._goalie_trend_slices(window_games, len(recent_games))
+        )
 
         sv_delta = (recent_sv - window_sv) / 0.01
         gaa_delta = (window_gaa - recent_gaa) / 0.10
@@ -528,6 +1284,43 @@ class AnalyticsService:
 
         return trend_score
 
+    @staticmethod
+    def _goalie_trend_slices(
+        games: List[PlayerGameStats],
+        recent_count: int,
+    ) -> tuple[tuple[float, float, float, float], tuple[float, float, float, float]]:
+        """Save %, GAA, win rate and start rate for the newest ``recent_count`` games and for all ``games``.
+
+        Like the skater averages, both slices come from one pass, reading each
+        game's time on ice once.
+        """
+        gp = saves = shots = goals = wins = starts = 0
+        recent_totals = None
+        for idx, g in enumerate(games):
+            if idx == recent_count:
+                recent_totals = (gp, saves, shots, goals, wins, starts)
+            toi = g.time_on_ice or 0
+            if toi <= 0:
+                continue
+            gp += 1
+            saves += g.saves or 0
+            shots += g.shots_against or 0
+            goals += g.goals_against or 0
+            wins += g.wins or 0
+            starts += toi >= 2400
+        window_totals = (gp, saves, shots, goals, wins, starts)
+        if recent_totals is None:
+            recent_totals = window_totals
+
+        def rates(totals: tuple[int, ...]) -> tuple[float, float, float, float]:
+            gp, saves, shots, goals, wins, starts = totals
+            if gp == 0:
+                return 0.0, 0.0, 0.0, 0.0
+            sv_pct = saves / shots if shots > 0 else 0.0
+            return sv_pct, goals / gp, wins / gp, starts / gp
+
+        return rates(recent_totals), rates(window_totals)
+
     @staticmethod
     def _calculate_temperature_tag(
         position: str,
@@ -583,74 +1376,51 @@ class AnalyticsService:
         ownership: float,
         score_config: Optional[dict] = None,
     ) -> float:
-        def clamp(value: float, min_value: float = 0.0, max_value: float = 1.0) -> float:
-            return max(min_value, min(value, max_value))
-
-        def scaled(value: float, cap: float, weight: float) -> float:
-            if cap <= 0:
-                return 0.0
-            return clamp(value / cap) * weight
-
-        config = score_config or get_default_streamer_score_config()
-        skater_cfg = config.get("skater", {})
-        weights = skater_cfg.get("weights", {})
-        caps_cfg = skater_cfg.get("caps", {})
-        toggles = skater_cfg.get("toggles", {})
-        toi_gate_cfg = skater_cfg.get("toi_gate", {})
+        params = AnalyticsService._skater_score_params(
+            score_config or DEFAULT_STREAMER_SCORE_CONFIG,
+            position == "D",
+        )
 
-        is_defense = position == "D"
-        caps = caps_cfg.get("defense" if is_defense else "forward", {})
+        rates = (ppg, spg, ppp_pg, toi_pg, hpg + bpg)
+        if not params.use_hits_blocks:
+            rates = rates[:-1]
 
         score = 0.0
-        score += scaled(ppg, caps.get("points_per_game", 1.0), weights.get("points_per_game", 0.0))
-        score += scaled(spg, caps.get("shots_per_game", 1.0), weights.get("shots_per_game", 0.0))
-        score += scaled(
-            ppp_pg,
-            caps.get("power_play_points_per_game", 1.0),
-            weights.get("power_play_points_per_game", 0.0),
-        )
-        score += scaled(
-            toi_pg,
-            caps.get("time_on_ice_per_game", 1.0),
-            weights.get("time_on_ice_per_game", 0.0),
-        )
-        if toggles.get("use_hits_blocks", True):
-            score += scaled(
-                hpg + bpg,
-                caps.get("hits_blocks_per_game", 1.0),
-                weights.get("hits_blocks_per_game", 0.0),
-            )
-
-        if toggles.get("use_plus_minus", True):
-            pm_score = clamp((pm_pg + 1.0) / 2.0)
-            score += pm_score * weights.get("plus_minus_per_game", 0.0)
+        for rate, cap, weight in zip(rates, params.rate_caps, params.rate_weights):
+            score += _scaled(rate, cap, weight)
 
-        if toggles.get("use_trend_bonus", True):
-            if trend == "hot":
-                score += weights.get("trend_hot_bonus", 0.0)
-            elif trend == "stable":
-                score += weights.get("trend_stable_bonus", 0.0)
+        if params.use_plus_minus:
+            pm_score = max(0.0, min((pm_pg + 1.0) / 2.0, 1.0))
+            score += pm_score * params.plus_minus_weight
 
-        if toggles.get("use_toi_gate_for_availability", True):
-            toi_gate_floor = toi_gate_cfg.get("defense_floor", 16.0) if is_defense else toi_gate_cfg.get(
-                "forward_floor", 14.0
-            )
-            toi_cap = caps.get("time_on_ice_per_game", 1.0)
-            toi_gate_range = toi_cap - toi_gate_floor
-            if toi_gate_range > 0:
-                toi_gate = clamp((toi_pg - toi_gate_floor) / toi_gate_range)
-            else:
-                toi_gate = 1.0
-        else:
-            toi_gate = 1.0
+        score += params.trend_bonuses.get(trend, 0.0)
 
-        if toggles.get("use_availability_bonus", False):
-            availability = clamp((100.0 - ownership) / 100.0) * weights.get("availability_bonus", 0.0)
-            availability *= toi_gate
+        if params.use_availability_bonus:
+            availability = max(0.0, min((100.0 - ownership) / 100.0, 1.0)) * params.availability_weight
+            availability *= params.toi_gate(toi_pg)
             score += availability
 
         return min(score, 100.0)
 
+    @staticmethod
+    def _skater_score_params(score_config: dict[str, Any], is_defense: bool) -> SkaterScoreParams:
+        role = "D" if is_defense else "F"
+        cached = _SCORE_PARAMS.get(role)
+        if cached is not None and cached[0] is score_config:
+            return cached[1]
+        params = SkaterScoreParams.from_config(score_config, is_defense)
+        _SCORE_PARAMS[role] = (score_config, params)
+        return params
+
+    @staticmethod
+    def _goalie_score_params(score_config: dict[str, Any]) -> GoalieScoreParams:
+        cached = _SCORE_PARAMS.get("G")
+        if cached is not None and cached[0] is score_config:
+            return cached[1]
+        params = GoalieScoreParams.from_config(score_config)
+        _SCORE_PARAMS["G"] = (score_config, params)
+        return params
+
     @staticmethod
     def _calculate_goalie_streamer_score(
         sv_pct: float,
@@ -663,45 +1433,37 @@ class AnalyticsService:
         ownership: float,
         score_config: Optional[dict] = None,
     ) -> float:
-        def clamp(value: float, min_value: float = 0.0, max_value: float = 1.0) -> float:
-            return max(min_value, min(value, max_value))
-
         if gp <= 0:
             return 0.0
 
-        config = score_config or get_default_streamer_score_config()
-        goalie_cfg = config.get("goalie", {})
-        weights = goalie_cfg.get("weights", {})
-        scales = goalie_cfg.get("scales", {})
-        toggles = goalie_cfg.get("toggles", {})
+        params = AnalyticsService._goalie_score_params(score_config or DEFAULT_STREAMER_SCORE_CONFIG)
 
         score = 0.0
-        sv_floor = scales.get("save_percentage_floor", 0.88)
-        sv_range = scales.get("save_percentage_range", 0.05)
-        gaa_ceiling = scales.get("goals_against_average_ceiling", 3.5)
-        gaa_range = scales.get("goals_against_average_range", 1.5)
-
-        sv_score = clamp((sv_pct - sv_floor) / max(sv_range, 0.0001)) * weights.get("save_percentage", 0.0)
-        gaa_score = clamp((gaa_ceiling - gaa) / max(gaa_range, 0.0001)) * weights.get("goals_against_average", 0.0)
+        sv_norm = max(
+            0.0,
+            min((sv_pct - params.save_percentage_floor) / params.save_percentage_range, 1.0),
+        )
+        sv_score = sv_norm * params.save_percentage_weight
+        gaa_norm = max(
+            0.0,
+            min((params.goals_against_average_ceiling - gaa) / params.goals_against_average_range, 1.0),
+        )
+        gaa_score = gaa_norm * params.goals_against_average_weight
         win_rate = wins / gp if gp > 0 else 0.0
-        win_score = clamp(win_rate) * weights.get("wins", 0.0)
+        win_score = max(0.0, min(win_rate, 1.0)) * params.wins_weight
         denom_games = expected_games if expected_games and expected_games > 0 else gp
         start_rate = games_started / denom_games if denom_games > 0 else 0.0
-        start_score = clamp(start_rate) * weights.get("starts", 0.0)
+        start_score = max(0.0, min(start_rate, 1.0)) * params.starts_weight
 
         score += sv_score + gaa_score + win_score + start_score
 
-        if toggles.get("use_trend_bonus", True):
-            if trend == "hot":
-                score += weights.get("trend_hot_bonus", 0.0)
-            elif trend == "stable":
-                score += weights.get("trend_stable_bonus", 0.0)
+        score += params.trend_bonuses.get(trend, 0.0)
 
-        if toggles.get("use_availability_bonus", False):
-            availability = clamp((100.0 - ownership) / 100.0) * weights.get("availability_bonus", 0.0)
+        if params.use_availability_bonus:
+            availability = max(0.0, min((100.0 - ownership) / 100.0, 1.0)) * params.availability_weight
             score += availability
 
-        sample_factor = 0.7 if toggles.get("use_sample_penalty", True) and gp <= 1 else 1.0
+        sample_factor = 0.7 if params.use_sample_penalty and gp <= 1 else 1.0
 
         score *= sample_factor
         return min(score, 100.0)
@@ -724,6 +1486,7 @@ class AnalyticsService:
             "league_id": league.id,
             "league_type": (league.league_type or "categories").lower(),
             "scoring_weights": league.scoring_weights,
+            "scoring_terms": AnalyticsService._league_scoring_terms(league.scoring_weights),
         }
 
     @staticmethod
@@ -732,12 +1495,26 @@ class AnalyticsService:
 
     @staticmethod
     def _normalized_league_stat(stat_key: str) -> Optional[str]:
+        stat = AnalyticsService.LEAGUE_STAT_ALIASES_FAST.get(stat_key)
+        if stat is not None:
+            return stat
         normalized = stat_key.strip().lower()
         normalized = normalized.replace(" ", "_")
         return AnalyticsService.LEAGUE_STAT_ALIASES.get(normalized)
 
     @staticmethod
     def _league_cap_map(position: str, score_config: dict) -> dict[str, float]:
+        """Per-stat league caps for a position; shared per role and config, so callers must not mutate it."""
+        role = position if position in ("G", "D") else "F"
+        cached = _LEAGUE_CAP_MAPS.get(role)
+        if cached is not None and cached[0] is score_config:
+            return cached[1]
+        caps = AnalyticsService._build_league_cap_map(position, score_config)
+        _LEAGUE_CAP_MAPS[role] = (score_config, caps)
+        return caps
+
+    @staticmethod
+    def _build_league_cap_map(position: str, score_config: dict) -> dict[str, float]:
         is_goalie = position == "G"
         if is_goalie:
             goalie_cfg = score_config.get("goalie", {})
@@ -766,30 +1543,49 @@ class AnalyticsService:
         caps["blocks"] = max(1.0, hits_blocks_cap * 0.5)
         return caps
 
+    @staticmethod
+    def _league_scoring_terms(scoring_weights: dict[str, Any]) -> tuple[tuple[str, float], ...]:
+        """Normalize league scoring weights into (stat, weight) pairs, dropping unknown and zero weights."""
+        terms: list[tuple[str, float]] = []
+        for raw_stat, raw_weight in scoring_weights.items():
+            stat = AnalyticsService._normalized_league_stat(str(raw_stat))
+            if not stat:
+                continue
+            weight = float(raw_weight)
+            if weight == 0:
+                continue
+            terms.append((stat, weight))
+        return tuple(terms)
+
+    @staticmethod
+    def _league_category_terms(
+        scoring_terms: tuple[tuple[str, float], ...],
+        cap_map: dict[str, float],
+    ) -> tuple[tuple[str, float, float, bool], ...]:
+        lower_better_stats = AnalyticsService.LEAGUE_LOWER_BETTER_STATS
+        return tuple(
+            (stat, weight, max(0.01, float(cap_map.get(stat, 1.0))), stat in lower_better_stats)
+            for stat, weight in scoring_terms
+        )
+
     @staticmethod
     def _league_fit_score_categories(
-        scoring_weights: dict[str, Any],
+        category_terms: tuple[tuple[str, float, float, bool], ...],
         metrics: dict[str, float],
-        cap_map: dict[str, float],
     ) -> Optional[float]:
         weighted_sum = 0.0
         total_weight = 0.0
 
-        for raw_stat, raw_weight in scoring_weights.items():
-            stat = AnalyticsService._normalized_league_stat(str(raw_stat))
-            if not stat or stat not in metrics:
+        for stat, weight, cap, lower_better in category_terms:
+            if stat not in metrics:
                 continue
-            weight = float(raw_weight)
             abs_weight = abs(weight)
-            if abs_weight <= 0:
-                continue
-            value = float(metrics.get(stat, 0.0))
-            cap = max(0.01, float(cap_map.get(stat, 1.0)))
+            value = float(metrics[stat])
 
-            if stat in AnalyticsService.LEAGUE_LOWER_BETTER_STATS:
-                ratio = AnalyticsService._clamp((cap - value) / cap)
+            if lower_better:
+                ratio = max(0.0, min((cap - value) / cap, 1.0))
             else:
-                ratio = AnalyticsService._clamp(value / cap)
+                ratio = max(0.0, min(value / cap, 1.0))
 
             if weight < 0:
                 ratio = 1.0 - ratio
@@ -799,42 +1595,45 @@ class AnalyticsService:
 
         if total_weight <= 0:
             return None
-        return AnalyticsService._clamp(weighted_sum / total_weight) * 100.0
+        return max(0.0, min(weighted_sum / total_weight, 1.0)) * 100.0
+
+    @staticmethod
+    def _league_points_terms(
+        scoring_terms: tuple[tuple[str, float], ...],
+        cap_map: dict[str, float],
+    ) -> tuple[tuple[str, float, float, float, float, float], ...]:
+        """Resolve each points-league term's value range and its weighted point bounds."""
+        terms = []
+        for stat, weight in scoring_terms:
+            max_value = float(cap_map.get(stat, 1.0))
+            min_value = float(AnalyticsService.LEAGUE_MIN_VALUES.get(stat, 0.0))
+            if max_value < min_value:
+                max_value, min_value = min_value, max_value
+            if weight >= 0:
+                low_points, high_points = min_value * weight, max_value * weight
+            else:
+                low_points, high_points = max_value * weight, min_value * weight
+            terms.append((stat, weight, min_value, max_value, low_points, high_points))
+        return tuple(terms)
 
     @staticmethod
     def _league_fit_score_points(
-        scoring_weights: dict[str, Any],
+        points_terms: tuple[tuple[str, float, float, float, float, float], ...],
         metrics: dict[str, float],
-        cap_map: dict[str, float],
     ) -> Optional[float]:
         total_points = 0.0
         min_points = 0.0
         max_points = 0.0
         used = 0
 
-        for raw_stat, raw_weight in scoring_weights.items():
-            stat = AnalyticsService._normalized_league_stat(str(raw_stat))
-            if not stat or stat not in metrics:
-                continue
-            weight = float(raw_weight)
-            if weight == 0:
+        for stat, weight, min_value, max_value, low_points, high_points in points_terms:
+            if stat not in metrics:
                 continue
             used += 1
-            max_value = float(cap_map.get(stat, 1.0))
-            min_value = float(AnalyticsService.LEAGUE_MIN_VALUES.get(stat, 0.0))
-            if max_value < min_value:
-                max_value, min_value = min_value, max_value
-
-            value = float(metrics.get(stat, 0.0))
-            clamped_value = max(min_value, min(value, max_value))
-            total_points += clamped_value * weight
-
-            if weight >= 0:
-                max_points += max_value * weight
-                min_points += min_value * weight
-            else:
-                max_points += min_value * weight
-                min_points += max_value * weight
+            value = float(metrics[stat])
+            total_points += max(min_value, min(value, max_value)) * weight
+            max_points += high_points
+            min_points += low_points
 
         if used == 0:
             return None
@@ -842,7 +1641,7 @@ class AnalyticsService:
         if span <= 0:
             return None
         normalized = (total_points - min_points) / span
-        return AnalyticsService._clamp(normalized) * 100.0
+        return max(0.0, min(normalized, 1.0)) * 100.0
 
     @staticmethod
     def _calculate_league_fit_score(
@@ -851,42 +1650,103 @@ class AnalyticsService:
         metrics: dict[str, float],
         score_config: dict[str, Any],
     ) -> Optional[float]:
+        plan = AnalyticsService._league_fit_plan(league_context, position, score_config)
+        if plan is None:
+            return None
+        if plan.is_points:
+            return AnalyticsService._league_fit_score_points(plan.points_terms, metrics)
+        return AnalyticsService._league_fit_score_categories(plan.category_terms, metrics)
+
+    @staticmethod
+    def _league_fit_plan(
+        league_context: dict[str, Any],
+        position: str,
+        score_config: dict[str, Any],
+    ) -> Optional[LeagueFitPlan]:
+        # Caps only differ between goalies, defense and forwards. Plans are
+        # memoized on the (per-request) league context for the config they
+        # were built from.
+        role = position if position in ("G", "D") else "F"
+        plans = league_context.setdefault("fit_plans", {})
+        cached = plans.get(role)
+        if cached is not None and cached[0] is score_config:
+            return cached[1]
+
         scoring_weights = league_context.get("scoring_weights")
         if not isinstance(scoring_weights, dict) or not scoring_weights:
             return None
 
+        scoring_terms = league_context.get("scoring_terms")
+        if scoring_terms is None:
+            scoring_terms = AnalyticsService._league_scoring_terms(scoring_weights)
         league_type = str(league_context.get("league_type") or "categories").lower()
+        is_points = league_type == "points"
         cap_map = AnalyticsService._league_cap_map(position, score_config)
-        if league_type == "points":
-            return AnalyticsService._league_fit_score_points(scoring_weights, metrics, cap_map)
-        return AnalyticsService._league_fit_score_categories(scoring_weights, metrics, cap_map)
+        plan = LeagueFitPlan(
+            is_points=is_points,
+            scoring_terms=scoring_terms,
+            cap_map=cap_map,
+            category_terms=(
+                () if is_points else AnalyticsService._league_category_terms(scoring_terms, cap_map)
+            ),
+            points_terms=(
+                AnalyticsService._league_points_terms(scoring_terms, cap_map) if is_points else ()
+            ),
+        )
+        plans[role] = (score_config, plan)
+        return plan
 
     @staticmethod
-    def _apply_league_influence(
-        base_streamer_score: float,
+    def _league_influence_params(score_config: dict[str, Any]) -> LeagueInfluenceParams:
+        cached = _SCORE_PARAMS.get("league")
+        if cached is not None and cached[0] is score_config:
+            return cached[1]
+        params = LeagueInfluenceParams.from_config(score_config)
+        _SCORE_PARAMS["league"] = (score_config, params)
+        return params
+
+    @staticmethod
+    def _prepare_scoring(score_config: dict[str, Any], league_context: Optional[dict[str, Any]]) -> None:
+        """Resolve score params and league fit plans for every role ahead of a player sweep."""
+        AnalyticsService._skater_score_params(score_config, False)
+        AnalyticsService._skater_score_params(score_config, True)
+        AnalyticsService._goalie_score_params(score_config)
+        AnalyticsService._league_influence_params(score_config)
+        if league_context:
+            for position in ("F", "D", "G"):
+                AnalyticsService._league_fit_plan(league_context, position, score_config)
+
+    @staticmethod
+    def _league_blend_weight(
         score_config: dict[str, Any],
         league_context: Optional[dict[str, Any]],
         games_played: int,
-        player_position: str,
-        metrics: dict[str, float],
     ) -> float:
-        league_cfg = score_config.get("league_influence", {})
-        if not league_cfg.get("enabled", True):
-            return base_streamer_score
+        """Weight of the league fit in the final score; 0.0 when league influence does not apply."""
+        params = AnalyticsService._league_influence_params(score_config)
+        if not params.enabled:
+            return 0.0
         if not league_context:
-            return base_streamer_score
+            return 0.0
 
-        blend_weight = AnalyticsService._clamp(float(league_cfg.get("weight", 0.35)))
+        blend_weight = params.weight
         if blend_weight <= 0:
-            return base_streamer_score
+            return 0.0
 
-        min_games = int(max(0, float(league_cfg.get("minimum_games", 3))))
+        min_games = params.minimum_games
         if min_games > 0 and games_played < min_games:
-            blend_weight *= AnalyticsService._clamp(games_played / min_games)
-
-        if blend_weight <= 0:
-            return base_streamer_score
+            blend_weight *= max(0.0, min(games_played / min_games, 1.0))
+        return blend_weight
 
+    @staticmethod
+    def _apply_league_influence(
+        base_streamer_score: float,
+        score_config: dict[str, Any],
+        league_context: dict[str, Any],
+        blend_weight: float,
+        player_position: str,
+        metrics: dict[str, float],
+    ) -> float:
         league_fit = AnalyticsService._calculate_league_fit_score(
             league_context=league_context,
             position=player_position,
@@ -897,7 +1757,7 @@ class AnalyticsService:
             return base_streamer_score
 
         blended = ((1.0 - blend_weight) * base_streamer_score) + (blend_weight * league_fit)
-        return AnalyticsService._clamp(blended, 0.0, 100.0)
+        return max(0.0, min(blended, 100.0))
 
     @staticmethod
     def explain_streamer_score(
@@ -906,7 +1766,7 @@ class AnalyticsService:
         score_config: Optional[dict[str, Any]] = None,
         league_context: Optional[dict[str, Any]] = None,
     ) -> dict[str, Any]:
-        config = score_config or get_default_streamer_score_config()
+        config = score_config or DEFAULT_STREAMER_SCORE_CONFIG
         if player.position == "G":
             return AnalyticsService._explain_goalie_streamer_score(
                 player=player,
@@ -928,46 +1788,9 @@ class AnalyticsService:
         score_config: dict[str, Any],
         league_context: Optional[dict[str, Any]],
     ) -> dict[str, Any]:
-        def _component(
-            key: str,
-            label: str,
-            *,
-            enabled: bool,
-            metric_value: Optional[float] = None,
-            cap: Optional[float] = None,
-            weight: Optional[float] = None,
-            normalized_value: Optional[float] = None,
-            raw_contribution: float = 0.0,
-            notes: Optional[str] = None,
-        ) -> dict[str, Any]:
-            return {
-                "key": key,
-                "label": label,
-                "enabled": enabled,
-                "metric_value": metric_value,
-                "cap": cap,
-                "weight": weight,
-                "normalized_value": normalized_value,
-                "raw_contribution": raw_contribution,
-                "base_contribution": 0.0,
-                "final_contribution": 0.0,
-                "notes": notes,
-            }
-
-        def _scaled(metric: float, cap: float, weight: float) -> tuple[float, float]:
-            if cap <= 0:
-                return 0.0, 0.0
-            normalized = AnalyticsService._clamp(metric / cap)
-            return normalized, normalized * weight
-
-        skater_cfg = score_config.get("skater", {})
-        weights = skater_cfg.get("weights", {})
-        caps_cfg = skater_cfg.get("caps", {})
-        toggles = skater_cfg.get("toggles", {})
-        toi_gate_cfg = skater_cfg.get("toi_gate", {})
-
-        is_defense = player.position == "D"
-        caps = caps_cfg.get("defense" if is_defense else "forward", {})
+        params = AnalyticsService._skater_score_params(score_config, player.position == "D")
+        points_cap, shots_cap, ppp_cap, toi_cap, hits_blocks_cap = params.rate_caps
+        points_weight, shots_weight, ppp_weight, toi_weight, hits_blocks_weight = params.rate_weights
 
         ppg = float(rolling_stats.points_per_game or 0.0)
         spg = float(rolling_stats.shots_per_game or 0.0)
@@ -980,107 +1803,89 @@ class AnalyticsService:
         ownership = float(player.ownership_percentage or 0.0)
         games_played = int(rolling_stats.games_played or 0)
 
-        components: list[dict[str, Any]] = []
+        components: list[ScoreComponent] = []
 
-        points_norm, points_contrib = _scaled(
-            ppg,
-            float(caps.get("points_per_game", 1.0)),
-            float(weights.get("points_per_game", 0.0)),
-        )
+        points_norm, points_contrib = _scaled_with_norm(ppg, points_cap, points_weight)
         components.append(
-            _component(
+            ScoreComponent(
                 "points_per_game",
                 "Points / GP",
                 enabled=True,
                 metric_value=ppg,
-                cap=float(caps.get("points_per_game", 1.0)),
-                weight=float(weights.get("points_per_game", 0.0)),
+                cap=points_cap,
+                weight=points_weight,
                 normalized_value=points_norm,
                 raw_contribution=points_contrib,
             )
         )
 
-        shots_norm, shots_contrib = _scaled(
-            spg,
-            float(caps.get("shots_per_game", 1.0)),
-            float(weights.get("shots_per_game", 0.0)),
-        )
+        shots_norm, shots_contrib = _scaled_with_norm(spg, shots_cap, shots_weight)
         components.append(
-            _component(
+            ScoreComponent(
                 "shots_per_game",
                 "Shots / GP",
                 enabled=True,
                 metric_value=spg,
-                cap=float(caps.get("shots_per_game", 1.0)),
-                weight=float(weights.get("shots_per_game", 0.0)),
+                cap=shots_cap,
+                weight=shots_weight,
                 normalized_value=shots_norm,
                 raw_contribution=shots_contrib,
             )
         )
 
-        ppp_norm, ppp_contrib = _scaled(
-            ppp_pg,
-            float(caps.get("power_play_points_per_game", 1.0)),
-            float(weights.get("power_play_points_per_game", 0.0)),
-        )
+        ppp_norm, ppp_contrib = _scaled_with_norm(ppp_pg, ppp_cap, ppp_weight)
         components.append(
-            _component(
+            ScoreComponent(
                 "power_play_points_per_game",
                 "Power Play Points / GP",
                 enabled=True,
                 metric_value=ppp_pg,
-                cap=float(caps.get("power_play_points_per_game", 1.0)),
-                weight=float(weights.get("power_play_points_per_game", 0.0)),
+                cap=ppp_cap,
+                weight=ppp_weight,
                 normalized_value=ppp_norm,
                 raw_contribution=ppp_contrib,
             )
         )
 
-        toi_norm, toi_contrib = _scaled(
-            toi_pg,
-            float(caps.get("time_on_ice_per_game", 1.0)),
-            float(weights.get("time_on_ice_per_game", 0.0)),
-        )
+        toi_norm, toi_contrib = _scaled_with_norm(toi_pg, toi_cap, toi_weight)
         components.append(
-            _component(
+            ScoreComponent(
                 "time_on_ice_per_game",
                 "Time On Ice / GP",
                 enabled=True,
                 metric_value=toi_pg,
-                cap=float(caps.get("time_on_ice_per_game", 1.0)),
-                weight=float(weights.get("time_on_ice_per_game", 0.0)),
+                cap=toi_cap,
+                weight=toi_weight,
                 normalized_value=toi_norm,
                 raw_contribution=toi_contrib,
             )
         )
 
-        use_hits_blocks = bool(toggles.get("use_hits_blocks", True))
+        use_hits_blocks = params.use_hits_blocks
         hits_blocks_metric = hpg + bpg
-        hits_blocks_norm, hits_blocks_contrib = _scaled(
-            hits_blocks_metric,
-            float(caps.get("hits_blocks_per_game", 1.0)),
-            float(weights.get("hits_blocks_per_game", 0.0)),
-        )
+        hits_blocks_norm, hits_blocks_contrib = _scaled_with_norm(hits_blocks_metric, hits_blocks_cap, hits_blocks_weight)
+        if not use_hits_blocks:
+            hits_blocks_contrib = 0.0
         components.append(
-            _component(
+            ScoreComponent(
                 "hits_blocks_per_game",
                 "Hits + Blocks / GP",
                 enabled=use_hits_blocks,
                 metric_value=hits_blocks_metric,
-                cap=float(caps.get("hits_blocks_per_game", 1.0)),
-                weight=float(weights.get("hits_blocks_per_game", 0.0)),
+                cap=hits_blocks_cap,
+                weight=hits_blocks_weight,
                 normalized_value=hits_blocks_norm,
-                raw_contribution=hits_blocks_contrib if use_hits_blocks else 0.0,
+                raw_contribution=hits_blocks_contrib,
                 notes=None if use_hits_blocks else "Disabled in skater toggles",
             )
         )
 
-        use_plus_minus = bool(toggles.get("use_plus_minus", True))
-        plus_minus_norm = AnalyticsService._clamp((pm_pg + 1.0) / 2.0)
-        plus_minus_weight = float(weights.get("plus_minus_per_game", 0.0))
+        use_plus_minus = params.use_plus_minus
+        plus_minus_norm = max(0.0, min((pm_pg + 1.0) / 2.0, 1.0))
+        plus_minus_weight = params.plus_minus_weight
         plus_minus_contrib = plus_minus_norm * plus_minus_weight if use_plus_minus else 0.0
         components.append(
-            _component(
+            ScoreComponent(
                 "plus_minus_per_game",
                 "Plus Minus / GP",
                 enabled=use_plus_minus,
@@ -1092,17 +1897,12 @@ class AnalyticsService:
             )
         )
 
-        use_trend_bonus = bool(toggles.get("use_trend_bonus", True))
-        trend_hot_bonus = float(weights.get("trend_hot_bonus", 0.0))
-        trend_stable_bonus = float(weights.get("trend_stable_bonus", 0.0))
-        trend_contrib = 0.0
-        if use_trend_bonus:
-            if trend == "hot":
-                trend_contrib = trend_hot_bonus
-            elif trend == "stable":
-                trend_contrib = trend_stable_bonus
+        use_trend_bonus = params.use_trend_bonus
+        trend_hot_bonus = params.trend_hot_bonus
+        trend_stable_bonus = params.trend_stable_bonus
+        trend_contrib = params.trend_bonuses.get(trend, 0.0)
         components.append(
-            _component(
+            ScoreComponent(
                 "trend_bonus",
                 "Trend Bonus",
                 enabled=use_trend_bonus,
@@ -1112,30 +1912,16 @@ class AnalyticsService:
             )
         )
 
-        use_toi_gate = bool(toggles.get("use_toi_gate_for_availability", True))
-        if use_toi_gate:
-            toi_gate_floor = float(
-                toi_gate_cfg.get("defense_floor", 16.0)
-                if is_defense
-                else toi_gate_cfg.get("forward_floor", 14.0)
-            )
-            toi_cap = float(caps.get("time_on_ice_per_game", 1.0))
-            toi_gate_range = toi_cap - toi_gate_floor
-            if toi_gate_range > 0:
-                toi_gate_factor = AnalyticsService._clamp((toi_pg - toi_gate_floor) / toi_gate_range)
-            else:
-                toi_gate_factor = 1.0
-        else:
-            toi_gate_factor = 1.0
+        toi_gate_factor = params.toi_gate(toi_pg)
 
-        use_availability_bonus = bool(toggles.get("use_availability_bonus", False))
-        availability_weight = float(weights.get("availability_bonus", 0.0))
-        availability_norm = AnalyticsService._clamp((100.0 - ownership) / 100.0)
+        use_availability_bonus = params.use_availability_bonus
+        availability_weight = params.availability_weight
+        availability_norm = max(0.0, min((100.0 - ownership) / 100.0, 1.0))
         availability_contrib = 0.0
         if use_availability_bonus:
             availability_contrib = availability_norm * availability_weight * toi_gate_factor
         components.append(
-            _component(
+            ScoreComponent(
                 "availability_bonus",
                 "Availability Bonus",
                 enabled=use_availability_bonus,
@@ -1151,57 +1937,58 @@ class AnalyticsService:
             )
         )
 
-        base_score_before_cap = float(sum(component["raw_contribution"] for component in components))
-        base_cap_factor = 1.0
-        if base_score_before_cap > 100.0 and base_score_before_cap > 0:
-            base_cap_factor = 100.0 / base_score_before_cap
+        base_score_before_cap = float(
+            points_contrib
+            + shots_contrib
+            + ppp_contrib
+            + toi_contrib
+            + hits_blocks_contrib
+            + plus_minus_contrib
+            + trend_contrib
+            + availability_contrib
+        )
+        base_cap_factor = 100.0 / base_score_before_cap if base_score_before_cap > 100.0 else 1.0
         base_score = min(base_score_before_cap, 100.0)
 
-        for component in components:
-            component["base_contribution"] = float(component["raw_contribution"] * base_cap_factor)
-
-        league_cfg = score_config.get("league_influence", {})
         league_fit_score: Optional[float] = None
-        league_blend_weight = 0.0
+        league_blend_weight = AnalyticsService._league_blend_weight(score_config, league_context, games_played)
         league_component = 0.0
 
-        if bool(league_cfg.get("enabled", True)) and league_context:
-            league_blend_weight = AnalyticsService._clamp(float(league_cfg.get("weight", 0.35)))
-            min_games = int(max(0, float(league_cfg.get("minimum_games", 3))))
-            if min_games > 0 and games_played < min_games:
-                league_blend_weight *= AnalyticsService._clamp(games_played / min_games)
-            if league_blend_weight > 0:
-                league_fit_score = AnalyticsService._calculate_league_fit_score(
-                    league_context=league_context,
-                    position=player.position,
-                    metrics={
-                        "goals": float(rolling_stats.goals_per_game or 0.0),
-                        "assists": float(rolling_stats.assists_per_game or 0.0),
-                        "points": ppg,
-                        "shots": spg,
-                        "hits": hpg,
-                        "blocks": bpg,
-                        "plus_minus": pm_pg,
-                        "pim": float(rolling_stats.pim_per_game or 0.0),
-                        "power_play_points": ppp_pg,
-                        "shorthanded_points": float(rolling_stats.shorthanded_points_per_game or 0.0),
-                        "time_on_ice": toi_pg,
-                    },
-                    score_config=score_config,
-                )
-            if league_fit_score is None:
-                league_blend_weight = 0.0
+        if league_blend_weight > 0:
+            league_fit_score = AnalyticsService._calculate_league_fit_score(
+                league_context=league_context,
+                position=player.position,
+                metrics={
+                    "goals": float(rolling_stats.goals_per_game or 0.0),
+                    "assists": float(rolling_stats.assists_per_game or 0.0),
+                    "points": ppg,
+                    "shots": spg,
+                    "hits": hpg,
+                    "blocks": bpg,
+                    "plus_minus": pm_pg,
+                    "pim": float(rolling_stats.pim_per_game or 0.0),
+                    "power_play_points": ppp_pg,
+                    "shorthanded_points": float(rolling_stats.shorthanded_points_per_game or 0.0),
+                    "time_on_ice": toi_pg,
+                },
+                score_config=score_config,
+            )
+        if league_fit_score is None:
+            league_blend_weight = 0.0
 
-        if league_blend_weight > 0 and league_fit_score is not None:
-            for component in components:
-                component["final_contribution"] = float(component["base_contribution"] * (1.0 - league_blend_weight))
+        # Base (cap-scaled) and final (league-blended) contributions in one pass.
+        # The blend weight is 0.0 whenever there is no league fit, so scaling by
+        # the kept weight leaves unblended contributions untouched.
+        keep_weight = 1.0 - league_blend_weight
+        for component in components:
+            base_contribution = float(component.raw_contribution * base_cap_factor)
+            component.base_contribution = base_contribution
+            component.final_contribution = float(base_contribution * keep_weight)
+        if league_fit_score is not None:
             league_component = float(league_fit_score * league_blend_weight)
-        else:
-            for component in components:
-                component["final_contribution"] = float(component["base_contribution"])
 
         components.append(
-            _component(
+            ScoreComponent(
                 "league_fit_blend",
                 "League Fit Blend",
                 enabled=league_blend_weight > 0 and league_fit_score is not None,
@@ -1217,14 +2004,10 @@ class AnalyticsService:
                 ),
             )
         )
-        components[-1]["base_contribution"] = float(league_component)
-        components[-1]["final_contribution"] = float(league_component)
+        components[-1].base_contribution = float(league_component)
+        components[-1].final_contribution = float(league_component)
 
-        final_score = AnalyticsService._clamp(
-            ((1.0 - league_blend_weight) * base_score) + league_component,
-            0.0,
-            100.0,
-        )
+        final_score = max(0.0, min(((1.0 - league_blend_weight) * base_score) + league_component, 100.0))
 
         return {
             "player_id": player.id,
@@ -1241,7 +2024,7 @@ class AnalyticsService:
             "league_blend_weight": league_blend_weight,
             "league_component_contribution": league_component,
             "final_score": final_score,
-            "components": components,
+            "components": [component.to_dict() for component in components],
         }
 
     @staticmethod
@@ -1251,36 +2034,7 @@ class AnalyticsService:
         score_config: dict[str, Any],
         league_context: Optional[dict[str, Any]],
     ) -> dict[str, Any]:
-        def _component(
-            key: str,
-            label: str,
-            *,
-            enabled: bool,
-            metric_value: Optional[float] = None,
-            cap: Optional[float] = None,
-            weight: Optional[float] = None,
-            normalized_value: Optional[float] = None,
-            raw_contribution: float = 0.0,
-            notes: Optional[str] = None,
-        ) -> dict[str, Any]:
-            return {
-                "key": key,
-                "label": label,
-                "enabled": enabled,
-                "metric_value": metric_value,
-                "cap": cap,
-                "weight": weight,
-                "normalized_value": normalized_value,
-                "raw_contribution": raw_contribution,
-                "base_contribution": 0.0,
-                "final_contribution": 0.0,
-                "notes": notes,
-            }
-
-        goalie_cfg = score_config.get("goalie", {})
-        weights = goalie_cfg.get("weights", {})
-        scales = goalie_cfg.get("scales", {})
-        toggles = goalie_cfg.get("toggles", {})
+        params = AnalyticsService._goalie_score_params(score_config)
 
         games_played = int(rolling_stats.games_played or 0)
         games_started = int(rolling_stats.goalie_games_started or 0)
@@ -1291,81 +2045,77 @@ class AnalyticsService:
         gaa = float(rolling_stats.goals_against_average or 0.0)
         wins = float(rolling_stats.goalie_wins or 0.0)
 
-        sv_floor = float(scales.get("save_percentage_floor", 0.88))
-        sv_range = max(float(scales.get("save_percentage_range", 0.05)), 0.0001)
-        gaa_ceiling = float(scales.get("goals_against_average_ceiling", 3.5))
-        gaa_range = max(float(scales.get("goals_against_average_range", 1.5)), 0.0001)
+        sv_floor = params.save_percentage_floor
+        sv_range = params.save_percentage_range
+        gaa_ceiling = params.goals_against_average_ceiling
+        gaa_range = params.goals_against_average_range
 
-        sv_norm = AnalyticsService._clamp((sv_pct - sv_floor) / sv_range)
-        sv_contrib = sv_norm * float(weights.get("save_percentage", 0.0))
+        sv_norm = max(0.0, min((sv_pct - sv_floor) / sv_range, 1.0))
+        sv_contrib = sv_norm * params.save_percentage_weight
 
-        gaa_norm = AnalyticsService._clamp((gaa_ceiling - gaa) / gaa_range)
-        gaa_contrib = gaa_norm * float(weights.get("goals_against_average", 0.0))
+        gaa_norm = max(0.0, min((gaa_ceiling - gaa) / gaa_range, 1.0))
+        gaa_contrib = gaa_norm * params.goals_against_average_weight
 
         win_rate = wins / games_played if games_played > 0 else 0.0
-        wins_norm = AnalyticsService._clamp(win_rate)
-        wins_contrib = wins_norm * float(weights.get("wins", 0.0))
+        wins_norm = max(0.0, min(win_rate, 1.0))
+        wins_contrib = wins_norm * params.wins_weight
 
-        expected_games = AnalyticsService.WINDOW_SIZES.get(rolling_stats.window) or games_played
+        window = rolling_stats.window
+        expected_games = _WINDOW_SIZES.get(window) or games_played
         denom_games = expected_games if expected_games and expected_games > 0 else games_played
         start_rate = games_started / denom_games if denom_games > 0 else 0.0
-        starts_norm = AnalyticsService._clamp(start_rate)
-        starts_contrib = starts_norm * float(weights.get("starts", 0.0))
+        starts_norm = max(0.0, min(start_rate, 1.0))
+        starts_contrib = starts_norm * params.starts_weight
 
-        components: list[dict[str, Any]] = [
-            _component(
+        components: list[ScoreComponent] = [
+            ScoreComponent(
                 "save_percentage",
                 "Save Percentage",
                 enabled=True,
                 metric_value=sv_pct,
-                cap=sv_floor + sv_range,
-                weight=float(weights.get("save_percentage", 0.0)),
+                cap=params.save_percentage_cap,
+                weight=params.save_percentage_weight,
                 normalized_value=sv_norm,
                 raw_contribution=sv_contrib,
             ),
-            _component(
+            ScoreComponent(
                 "goals_against_average",
                 "Goals Against Average",
                 enabled=True,
                 metric_value=gaa,
                 cap=gaa_ceiling,
-                weight=float(weights.get("goals_against_average", 0.0)),
+                weight=params.goals_against_average_weight,
                 normalized_value=gaa_norm,
                 raw_contribution=gaa_contrib,
             ),
-            _component(
+            ScoreComponent(
                 "wins",
                 "Wins Rate",
                 enabled=True,
                 metric_value=win_rate,
                 cap=1.0,
-                weight=float(weights.get("wins", 0.0)),
+                weight=params.wins_weight,
                 normalized_value=wins_norm,
                 raw_contribution=wins_contrib,
             ),
-            _component(
+            ScoreComponent(
                 "starts",
                 "Start Share",
                 enabled=True,
                 metric_value=start_rate,
                 cap=1.0,
-                weight=float(weights.get("starts", 0.0)),
+                weight=params.starts_weight,
                 normalized_value=starts_norm,
                 raw_contribution=starts_contrib,
             ),
         ]
 
-        use_trend_bonus = bool(toggles.get("use_trend_bonus", True))
-        trend_hot_bonus = float(weights.get("trend_hot_bonus", 0.0))
-        trend_stable_bonus = float(weights.get("trend_stable_bonus", 0.0))
-        trend_contrib = 0.0
-        if use_trend_bonus:
-            if trend == "hot":
-                trend_contrib = trend_hot_bonus
-            elif trend == "stable":
-                trend_contrib = trend_stable_bonus
+        use_trend_bonus = params.use_trend_bonus
+        trend_hot_bonus = params.trend_hot_bonus
+        trend_stable_bonus = params.trend_stable_bonus
+        trend_contrib = params.trend_bonuses.get(trend, 0.0)
         components.append(
-            _component(
+            ScoreComponent(
                 "trend_bonus",
                 "Trend Bonus",
                 enabled=use_trend_bonus,
@@ -1375,12 +2125,12 @@ class AnalyticsService:
             )
         )
 
-        use_availability_bonus = bool(toggles.get("use_availability_bonus", False))
-        availability_weight = float(weights.get("availability_bonus", 0.0))
-        availability_norm = AnalyticsService._clamp((100.0 - ownership) / 100.0)
+        use_availability_bonus = params.use_availability_bonus
+        availability_weight = params.availability_weight
+        availability_norm = max(0.0, min((100.0 - ownership) / 100.0, 1.0))
         availability_contrib = availability_norm * availability_weight if use_availability_bonus else 0.0
         components.append(
-            _component(
+            ScoreComponent(
                 "availability_bonus",
                 "Availability Bonus",
                 enabled=use_availability_bonus,
@@ -1396,55 +2146,51 @@ class AnalyticsService:
             )
         )
 
-        score_before_sample_penalty = float(sum(component["raw_contribution"] for component in components))
-        use_sample_penalty = bool(toggles.get("use_sample_penalty", True))
+        use_sample_penalty = params.use_sample_penalty
         sample_factor = 0.7 if use_sample_penalty and games_played <= 1 else 1.0
+        score_before_sample_penalty = 0.0
+        base_score_before_cap = 0.0
         for component in components:
-            component["raw_contribution"] = float(component["raw_contribution"] * sample_factor)
-
-        base_score_before_cap = float(sum(component["raw_contribution"] for component in components))
-        base_cap_factor = 1.0
-        if base_score_before_cap > 100.0 and base_score_before_cap > 0:
-            base_cap_factor = 100.0 / base_score_before_cap
+            raw_contribution = component.raw_contribution
+            score_before_sample_penalty += raw_contribution
+            raw_contribution = float(raw_contribution * sample_factor)
+            component.raw_contribution = raw_contribution
+            base_score_before_cap += raw_contribution
+        base_cap_factor = 100.0 / base_score_before_cap if base_score_before_cap > 100.0 else 1.0
         base_score = min(base_score_before_cap, 100.0)
-        for component in components:
-            component["base_contribution"] = float(component["raw_contribution"] * base_cap_factor)
 
-        league_cfg = score_config.get("league_influence", {})
         league_fit_score: Optional[float] = None
-        league_blend_weight = 0.0
+        league_blend_weight = AnalyticsService._league_blend_weight(score_config, league_context, games_played)
         league_component = 0.0
 
-        if bool(league_cfg.get("enabled", True)) and league_context:
-            league_blend_weight = AnalyticsService._clamp(float(league_cfg.get("weight", 0.35)))
-            min_games = int(max(0, float(league_cfg.get("minimum_games", 3))))
-            if min_games > 0 and games_played < min_games:
-                league_blend_weight *= AnalyticsService._clamp(games_played / min_games)
-            if league_blend_weight > 0:
-                league_fit_score = AnalyticsService._calculate_league_fit_score(
-                    league_context=league_context,
-                    position=player.position,
-                    metrics={
-                        "save_percentage": sv_pct,
-                        "goals_against_average": gaa,
-                        "wins": wins,
-                        "starts": float(games_started),
-                    },
-                    score_config=score_config,
-                )
-            if league_fit_score is None:
-                league_blend_weight = 0.0
+        if league_blend_weight > 0:
+            league_fit_score = AnalyticsService._calculate_league_fit_score(
+                league_context=league_context,
+                position=player.position,
+                metrics={
+                    "save_percentage": sv_pct,
+                    "goals_against_average": gaa,
+                    "wins": wins,
+                    "starts": float(games_started),
+                },
+                score_config=score_config,
+            )
+        if league_fit_score is None:
+            league_blend_weight = 0.0
 
-        if league_blend_weight > 0 and league_fit_score is not None:
-            for component in components:
-                component["final_contribution"] = float(component["base_contribution"] * (1.0 - league_blend_weight))
+        # Base (cap-scaled) and final (league-blended) contributions in one pass.
+        # The blend weight is 0.0 whenever there is no league fit, so scaling by
+        # the kept weight leaves unblended contributions untouched.
+        keep_weight = 1.0 - league_blend_weight
+        for component in components:
+            base_contribution = float(component.raw_contribution * base_cap_factor)
+            component.base_contribution = base_contribution
+            component.final_contribution = float(base_contribution * keep_weight)
+        if league_fit_score is not None:
             league_component = float(league_fit_score * league_blend_weight)
-        else:
-            for component in components:
-                component["final_contribution"] = float(component["base_contribution"])
 
         components.append(
-            _component(
+            ScoreComponent(
                 "league_fit_blend",
                 "League Fit Blend",
                 enabled=league_blend_weight > 0 and league_fit_score is not None,
@@ -1460,18 +2206,14 @@ class AnalyticsService:
                 ),
             )
         )
-        components[-1]["base_contribution"] = float(league_component)
-        components[-1]["final_contribution"] = float(league_component)
+        components[-1].base_contribution = float(league_component)
+        components[-1].final_contribution = float(league_component)
 
-        final_score = AnalyticsService._clamp(
-            ((1.0 - league_blend_weight) * base_score) + league_component,
-            0.0,
-            100.0,
-        )
+        final_score = max(0.0, min(((1.0 - league_blend_weight) * base_score) + league_component, 100.0))
 
         return {
             "player_id": player.id,
-            "window": rolling_stats.window,
+            "window": window,
             "position": player.position,
             "trend_direction": trend,
             "games_played": games_played,
@@ -1484,7 +2226,7 @@ class AnalyticsService:
             "league_blend_weight": league_blend_weight,
             "league_component_contribution": league_component,
             "final_score": final_score,
-            "components": components,
+            "components": [component.to_dict() for component in components],
         }
 
     @staticmethod
@@ -1493,16 +2235,17 @@ class AnalyticsService:
         window: str,
         season_id: str,
         game_type: int,
+        computed_at: Optional[datetime] = None,
     ) -> PlayerRollingStats:
-        return PlayerRollingStats(
+        return _new_rolling_stats(
             player_id=player_id,
             window=window,
             season_id=season_id,
             game_type=game_type,
-            window_size=AnalyticsService.WINDOW_SIZES.get(window),
+            window_size=_WINDOW_SIZES.get(window),
             games_played=0,
             goalie_games_started=0,
-            computed_at=datetime.utcnow(),
+            computed_at=computed_at or datetime.utcnow(),
             trend_direction="stable",
             temperature_tag="stable",
             streamer_score=0,
@@ -1511,21 +2254,281 @@ class AnalyticsService:
             total_goals_against=0,
         )
 
+    @staticmethod
+    def _sweep_window_stats(
+        db: Session,
+        players: Iterable[Player],
+        batch_size: int,
+        workers: int,
+        read_replica: bool = False,
+        **compute_kwargs: Any,
+    ) -> Iterator[tuple[Player, dict[str, PlayerRollingStats]]]:
+        """Yield ``(player, window stats)`` in player order.
+
+        Game logs are fetched with one query per batch of players. With more
+        than one worker, each batch is split across a thread pool where every
+        thread reads game logs through its own session; writes stay with the
+        caller on ``db``. The caller's transaction is committed first so the
+        worker sessions see the same game logs as a single-worker sweep.
+        Workers read from the primary unless ``read_replica`` is set, which
+        uses ``DATABASE_READ_URL`` when configured; a replica may lag behind
+        writes, so only opt in when no game logs were just written. Score
+        params and league fit plans must already be prepared so the workers
+        only read the shared caches.
+        """
+        if workers <= 1:
+            for batch in _player_batches(players, batch_size):
+                window_stats = AnalyticsService.compute_rolling_stats_multi_batch(db, batch, **compute_kwargs)
+                for player in batch:
+                    yield player, window_stats[player.id]
+            return
+
+        db.commit()
+        session_factory = read_sessionmaker(db.get_bind(), replica=read_replica)
+        local = threading.local()
+        sessions: list[Session] = []
+        sessions_lock = threading.Lock()
+
+        def compute(chunk: list[Player]) -> dict[str, dict[str, PlayerRollingStats]]:
+            session = getattr(local, "session", None)
+            if session is None:
+                session = session_factory()
+                local.session = session
+                with sessions_lock:
+                    sessions.append(session)
+            return AnalyticsService.compute_rolling_stats_multi_batch(session, chunk, **compute_kwargs)
+
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for batch in _player_batches(players, batch_size):
+                    chunk_size = -(-len(batch) // workers)
+                    chunks = [batch[start:start + chunk_size] for start in range(0, len(batch), chunk_size)]
+                    for chunk, window_stats in zip(chunks, executor.map(compute, chunks)):
+                        for player in chunk:
+                            yield player, window_stats[player.id]
+        finally:
+            for session in sessions:
+                session.close()
+
+    @staticmethod
+    def _write_rolling_stats(
+        db: Session,
+        to_insert: list[dict[str, Any]],
+        to_update: list[dict[str, Any]],
+    ) -> None:
+        """Write pending rolling stats rows as bulk statements and clear both lists."""
+        if to_update:
+            db.bulk_update_mappings(PlayerRollingStats, to_update)
+            to_update.clear()
+        if to_insert:
+            db.bulk_insert_mappings(PlayerRollingStats, to_insert)
+            to_insert.clear()
+
+    @staticmethod
+    def _scoring_inputs_fingerprint(
+        score_config: dict[str, Any],
+        league_context: Optional[dict[str, Any]],
+    ) -> str:
+        """Digest of everything besides game logs that streamer scores depend on."""
+        league = None
+        if league_context is not None:
+            league = [
+                league_context.get("league_id"),
+                league_context.get("league_type"),
+                league_context.get("scoring_weights"),
+            ]
+        encoded = json.dumps([score_config, league], sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _record_scoring_inputs(
+        db: Session,
+        score_config: dict[str, Any],
+        league_context: Optional[dict[str, Any]],
+    ) -> None:
+        from app.models.app_setting import AppSetting
+
+        fingerprint = AnalyticsService._scoring_inputs_fingerprint(score_config, league_context)
+        row = db.query(AppSetting).filter(AppSetting.key == ROLLING_STATS_INPUTS_KEY).first()
+        if row:
+            if row.value_json == fingerprint:
+                return
+            row.value_json = fingerprint
+            row.updated_at = datetime.utcnow()
+        else:
+            row = AppSetting(
+                key=ROLLING_STATS_INPUTS_KEY,
+                value_json=fingerprint,
+                updated_at=datetime.utcnow(),
+            )
+        db.add(row)
+
+    @staticmethod
+    def _unchanged_player_ids(
+        db: Session,
+        existing_rows: list,
+        season_id: str,
+        game_type: int,
+        score_config: dict[str, Any],
+        league_context: Optional[dict[str, Any]],
+    ) -> set[str]:
+        """Players whose stored rolling stats would come out the same if recomputed.
+
+        A player qualifies when every window is stored and the season row matches
+        the player's current game count, latest game date and summed game-log
+        totals, so a corrected box score is recomputed too. Nobody qualifies
+        unless the last completed sweep scored against the same score config and
+        active league (an edited, switched or deleted league changes everyone),
+        or while an availability bonus is enabled, since it follows ownership.
+        """
+        from app.models.app_setting import AppSetting
+
+        if (
+            AnalyticsService._skater_score_params(score_config, False).use_availability_bonus
+            or AnalyticsService._skater_score_params(score_config, True).use_availability_bonus
+            or AnalyticsService._goalie_score_params(score_config).use_availability_bonus
+        ):
+            return set()
+
+        swept_inputs = (
+            db.query(AppSetting.value_json)
+            .filter(AppSetting.key == ROLLING_STATS_INPUTS_KEY)
+            .scalar()
+        )
+        if swept_inputs != AnalyticsService._scoring_inputs_fingerprint(score_config, league_context):
+            return set()
+
+        window_counts: dict[str, int] = {}
+        season_rows = {}
+        for row in existing_rows:
+            window_counts[row.player_id] = window_counts.get(row.player_id, 0) + 1
+            if row.window == "Season":
+                season_rows[row.player_id] = row
+
+        # Goalie rows count only games with ice time, so either count can match.
+        game_logs = {
+            player_id: ({games, played}, last_game_date)
+            for player_id, games, played, last_game_date in db.query(
+                PlayerGameStats.player_id,
+                func.count(),
+                func.coalesce(func.sum(case((PlayerGameStats.time_on_ice > 0, 1), else_=0)), 0),
+                func.max(PlayerGameStats.date),
+            )
+            .filter(
+                PlayerGameStats.season_id == season_id,
+                PlayerGameStats.game_type == game_type,
+            )
+            .group_by(PlayerGameStats.player_id)
+        }
+
+        candidates = set()
+        for player_id, row in season_rows.items():
+            if window_counts[player_id] < len(_WINDOW_ITEMS):
+                continue
+            game_counts, last_game_date = game_logs.get(player_id, ({0}, None))
+            if (row.games_played or 0) in game_counts and row.last_game_date == last_game_date:
+                candidates.add(player_id)
+        if not candidates:
+            return set()
+
+        # A corrected box score keeps the game count and date, so the stored season
+        # totals must also match the game logs summed the way a recompute would.
+        players = db.query(Player.id, Player.position).filter(Player.id.in_(candidates)).all()
+        season_totals = AnalyticsService._player_season_totals(db, players, season_id, game_type)
+        stored_rows = db.query(PlayerRollingStats).filter(
+            PlayerRollingStats.player_id.in_(candidates),
+            PlayerRollingStats.season_id == season_id,
+            PlayerRollingStats.game_type == game_type,
+            PlayerRollingStats.window == "Season",
+        )
+        goalie_ids = {player.id for player in players if player.position == "G"}
+        unchanged: set[str] = set()
+        for row in stored_rows:
+            _, totals = season_totals.get(row.player_id, (0, None))
+            if totals is None:
+                continue
+            if row.player_id in goalie_ids:
+                stored = (
+                    row.games_played,
+                    row.goalie_games_started,
+                    row.total_saves,
+                    row.total_shots_against,
+                    row.total_goals_against,
+                    row.goalie_wins,
+                    row.goalie_shutouts,
+                )
+                if tuple(value or 0 for value in stored) == tuple(totals):
+                    unchanged.add(row.player_id)
+                continue
+            stored = (
+                row.total_goals,
+                row.total_assists,
+                row.total_points,
+                row.total_shots,
+                row.total_hits,
+                row.total_blocks,
+                row.total_plus_minus,
+                row.total_pim,
+                row.total_power_play_points,
+                row.total_shorthanded_points,
+            )
+            # Ice time is stored as minutes per game, so compare it back in seconds.
+            stored_toi = (row.time_on_ice_per_game or 0.0) * 60.0 * (row.games_played or 0)
+            if tuple(value or 0 for value in stored) == tuple(totals[:-1]) and abs(stored_toi - totals[-1]) < 1.0:
+                unchanged.add(row.player_id)
+        return unchanged
+
     @staticmethod
     def update_all_rolling_stats(
         db: Session,
         score_config: Optional[dict] = None,
         progress_callback: Optional[Callable[[int, int], None]] = None,
         progress_every: int = 25,
+        skip_unchanged: bool = False,
+        read_replica: bool = False,
     ) -> int:
-        """Update rolling stats for all players. Returns count updated."""
+        """Update rolling stats for all players. Returns count updated.
+
+        With ``skip_unchanged``, players whose stored rows already cover every
+        game log of the season are left as they are, provided the last completed
+        sweep used the same score config and active league. ``read_replica``
+        lets parallel workers read game logs from the replica; leave it off
+        right after a sync, since the replica may not have the new logs yet.
+        """
         season_id = current_season_id()
         game_type = current_game_type()
         score_config = score_config or get_streamer_score_config(db)
         league_context = AnalyticsService._active_league_context(db)
-        players = db.query(Player).filter(Player.is_active == True).all()
+        AnalyticsService._prepare_scoring(score_config, league_context)
+        active_players = db.query(Player).filter(Player.is_active == True)
+        batch_size = AnalyticsService.ROLLING_UPDATE_BATCH_SIZE
+        # One lookup for every stored row of this season instead of a SELECT per player and window.
+        existing_rows = db.query(
+            PlayerRollingStats.player_id,
+            PlayerRollingStats.window,
+            PlayerRollingStats.id,
+            PlayerRollingStats.games_played,
+            PlayerRollingStats.last_game_date,
+        ).filter(
+            PlayerRollingStats.season_id == season_id,
+            PlayerRollingStats.game_type == game_type,
+        ).all()
+        existing_ids = {(row.player_id, row.window): row.id for row in existing_rows}
+        if skip_unchanged:
+            unchanged_ids = AnalyticsService._unchanged_player_ids(
+                db, existing_rows, season_id, game_type, score_config, league_context
+            )
+            if unchanged_ids:
+                active_players = active_players.filter(Player.id.notin_(unchanged_ids))
+                AnalyticsService.logger.info(
+                    "Skipping %s players with no new games since their last rolling stats update",
+                    len(unchanged_ids),
+                )
+        total_players = active_players.count()
+        to_insert: list[dict[str, Any]] = []
+        to_update: list[dict[str, Any]] = []
+        touched: list[Player] = []
         count = 0
-        total_players = len(players)
         started_at = datetime.utcnow()
         AnalyticsService.logger.info(
             "Rolling stats update started (%s players, season=%s, game_type=%s)",
@@ -1534,34 +2537,31 @@ class AnalyticsService:
             game_type,
         )
 
-        for idx, player in enumerate(players, start=1):
+        sweep = AnalyticsService._sweep_window_stats(
+            db,
+            active_players.yield_per(batch_size),
+            batch_size,
+            get_settings().rolling_stats_workers,
+            read_replica=read_replica,
+            season_id=season_id,
+            game_type=game_type,
+            score_config=score_config,
+            league_context=league_context,
+            computed_at=started_at,
+        )
+        for idx, (player, window_stats) in enumerate(sweep, start=1):
+            touched.append(player)
             season_streamer_score = None
             l5_streamer_score = None
-            for window in AnalyticsService.WINDOW_SIZES.keys():
-                stats = AnalyticsService.compute_rolling_stats(
-                    db,
-                    player,
-                    window,
-                    season_id=season_id,
-                    game_type=game_type,
-                    score_config=score_config,
-                    league_context=league_context,
-                )
-
-                # Update or insert
-                existing = db.query(PlayerRollingStats).filter(
-                    PlayerRollingStats.player_id == player.id,
-                    PlayerRollingStats.window == window,
-                    PlayerRollingStats.season_id == season_id,
-                    PlayerRollingStats.game_type == game_type,
-                ).first()
-
-                if existing:
-                    for key, value in stats.__dict__.items():
-                        if not key.startswith('_'):
-                            setattr(existing, key, value)
+            for window, stats in window_stats.items():
+                # Update or insert; only the columns the stats set are written.
+                values = _rolling_stats_values(stats)
+                existing_id = existing_ids.pop((player.id, window), None)
+                if existing_id:
+                    values["id"] = existing_id
+                    to_update.append(values)
                 else:
-                    db.add(stats)
+                    to_insert.append(values)
 
                 if window == "Season":
                     season_streamer_score = stats.streamer_score
@@ -1585,6 +2585,18 @@ class AnalyticsService:
                     total_players,
                 )
 
+            if idx % batch_size == 0:
+                # Keep the identity map bounded; flushed changes still commit below.
+                AnalyticsService._write_rolling_stats(db, to_insert, to_update)
+                db.flush()
+                for obj in touched:
+                    db.expunge(obj)
+                touched.clear()
+
+        AnalyticsService._write_rolling_stats(db, to_insert, to_update)
+        # Committed with the rows, so an interrupted sweep leaves the old fingerprint
+        # and the next skip_unchanged sweep recomputes everyone.
+        AnalyticsService._record_scoring_inputs(db, score_config, league_context)
         db.commit()
         elapsed = (datetime.utcnow() - started_at).total_seconds()
         AnalyticsService.logger.info(
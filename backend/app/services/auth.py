@@ -2,9 +2,10 @@ from datetime import datetime, timedelta
 from typing import Optional
 import hashlib
 import secrets
+import bcrypt
 from jose import JWTError, jwt
 from passlib.context import CryptContext
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, load_only
 from fastapi import HTTPException, status
 
 from app.config import get_settings
@@ -12,7 +13,16 @@ from app.models.user import User
 from app.schemas.user import UserCreate, TokenData
 
 settings = get_settings()
+# Only consulted for stored hashes that are not bcrypt; new hashes come from bcrypt directly.
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+_BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+_BCRYPT_ROUNDS = 12
+# Settings are fixed for the life of the process, so the token parameters are resolved once.
+_SECRET_KEY = settings.secret_key
+_ALGORITHM = settings.algorithm
+_ALGORITHMS = [settings.algorithm]
+_ACCESS_TOKEN_TTL = timedelta(minutes=settings.access_token_expire_minutes)
+_REFRESH_TOKEN_TTL = timedelta(days=settings.refresh_token_expire_days)
 
 
 class AuthService:
@@ -22,59 +32,47 @@ class AuthService:
 
     @staticmethod
     def verify_password(plain_password: str, hashed_password: str) -> bool:
-        return pwd_context.verify(plain_password, hashed_password)
+        if not hashed_password.startswith(_BCRYPT_PREFIXES):
+            return pwd_context.verify(plain_password, hashed_password)
+        return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("utf-8"))
 
     @staticmethod
     def get_password_hash(password: str) -> str:
-        return pwd_context.hash(password)
+        return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=_BCRYPT_ROUNDS)).decode("utf-8")
 
     @staticmethod
     def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
         to_encode = data.copy()
-        if expires_delta:
-            expire = datetime.utcnow() + expires_delta
-        else:
-            expire = datetime.utcnow() + timedelta(minutes=settings.access_token_expire_minutes)
-        to_encode.update({"exp": expire})
-        encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
+        to_encode["exp"] = datetime.utcnow() + (expires_delta or _ACCESS_TOKEN_TTL)
+        encoded_jwt = jwt.encode(to_encode, _SECRET_KEY, algorithm=_ALGORITHM)
         return encoded_jwt
 
     @staticmethod
     def issue_refresh_token(db: Session, user: User) -> str:
+        # The user was loaded through this session, so committing is enough to write the new token.
         refresh_token = secrets.token_urlsafe(48)
+        now = datetime.utcnow()
         user.refresh_token_hash = AuthService._hash_refresh_token(refresh_token)
-        user.refresh_token_expires_at = datetime.utcnow() + timedelta(
-            days=settings.refresh_token_expire_days
-        )
-        user.refresh_token_last_used_at = datetime.utcnow()
-        db.add(user)
+        user.refresh_token_expires_at = now + _REFRESH_TOKEN_TTL
+        user.refresh_token_last_used_at = now
         db.commit()
         return refresh_token
 
     @staticmethod
     def rotate_refresh_token(db: Session, user: User) -> str:
-        refresh_token = secrets.token_urlsafe(48)
-        user.refresh_token_hash = AuthService._hash_refresh_token(refresh_token)
-        user.refresh_token_expires_at = datetime.utcnow() + timedelta(
-            days=settings.refresh_token_expire_days
-        )
-        user.refresh_token_last_used_at = datetime.utcnow()
-        db.add(user)
-        db.commit()
-        return refresh_token
+        return AuthService.issue_refresh_token(db, user)
 
     @staticmethod
     def clear_refresh_token(db: Session, user: User) -> None:
         user.refresh_token_hash = None
         user.refresh_token_expires_at = None
         user.refresh_token_last_used_at = None
-        db.add(user)
         db.commit()
 
     @staticmethod
     def decode_token(token: str) -> Optional[TokenData]:
         try:
-            payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+            payload = jwt.decode(token, _SECRET_KEY, algorithms=_ALGORITHMS)
             user_id: str = payload.get("sub")
             if user_id is None:
                 return None
@@ -130,4 +128,10 @@ class AuthService:
         if not refresh_token:
             return None
         token_hash = AuthService._hash_refresh_token(refresh_token)
-        return db.query(User).filter(User.refresh_token_hash == token_hash).first()
+        # Served by ix_users_refresh_token_hash; the refresh flow only needs these columns.
+        return (
+            db.query(User)
+            .options(load_only(User.id, User.refresh_token_hash, User.refresh_token_expires_at))
+            .filter(User.refresh_token_hash == token_hash)
+            .first()
+        )
@@ -0,0 +1,21 @@
+"""Backoff shared by the NHL API clients for rate-limited and gateway responses."""
+
+from __future__ import annotations
+
+import random
+
+import httpx
+
+# Statuses worth retrying: the server is throttling us or a gateway hiccupped.
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+RETRY_BACKOFF_BASE_SECONDS = 0.5
+RETRY_BACKOFF_CAP_SECONDS = 8.0
+
+
+def retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retry ``attempt``: the server's Retry-After, else backoff with jitter."""
+    retry_after = response.headers.get("retry-after")
+    if retry_after and retry_after.isdigit():
+        return min(float(retry_after), RETRY_BACKOFF_CAP_SECONDS)
+    backoff = min(RETRY_BACKOFF_CAP_SECONDS, RETRY_BACKOFF_BASE_SECONDS * 2 ** attempt)
+    return backoff + random.uniform(0, RETRY_BACKOFF_BASE_SECONDS)
@@ -4,42 +4,153 @@ NHL roster API client for fetching active team rosters.
 Uses api-web.nhle.com/v1 endpoints which are updated daily for call-ups/assignments.
 """
 
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 import logging
+import threading
+import time
 import httpx
 
+from app.config import get_settings
+from app.services.http_retry import RETRY_STATUSES, retry_delay
+
 try:
     from nhlpy import NHLClient
 except Exception:  # pragma: no cover - nhlpy may be missing in some local environments
     NHLClient = None
 
+try:
+    import orjson
+except Exception:  # pragma: no cover - fall back to httpx's stdlib decoding
+    orjson = None
+
 
 logger = logging.getLogger(__name__)
 
 ROSTER_API_BASE = "https://api-web.nhle.com/v1"
+# Team rosters fetched concurrently by fetch_all_rosters.
+ROSTER_FETCH_WORKERS = 8
+# Roster API responses are reused for this long; rosters change at most daily.
+ROSTER_CACHE_TTL_SECONDS = 3600.0
+
+# Retries for transient failures: connection errors are retried by the transport,
+# these statuses with exponential backoff and jitter (or the server's Retry-After).
+ROSTER_MAX_RETRIES = 3
+
+# Roster requests multiplex over one HTTP/2 connection when h2 is installed.
+_HTTP2_AVAILABLE = find_spec("h2") is not None
+
+# Roster payload keys that hold player lists, depending on the endpoint version.
+_ROSTER_GROUPS = ("forwards", "defensemen", "goalies", "skaters", "roster")
+
+# Failed paths are not re-requested for a while: missing team/season combos stay
+# missing, server errors usually clear sooner.
+_NOT_FOUND_TTL_SECONDS = 600.0
+_SERVER_ERROR_TTL_SECONDS = 60.0
+
+# path -> (fetched at, ETag, payload). Payloads are shared, so callers must not mutate them.
+_response_cache: Dict[str, Tuple[float, Optional[str], Any]] = {}
+# path -> monotonic time until which the path is known to fail.
+_failure_cache: Dict[str, float] = {}
+_response_cache_lock = threading.Lock()
+
+# Shared keep-alive client for the roster API, created on first use.
+_http_client: Optional[httpx.Client] = None
+_http_client_lock = threading.Lock()
 
 # Fallback list if team endpoint is unavailable.
-FALLBACK_TEAM_ABBREVS = [
+FALLBACK_TEAM_ABBREVS: Tuple[str, ...] = (
     "ANA", "BOS", "BUF", "CAR", "CBJ", "CGY", "CHI", "COL",
     "DAL", "DET", "EDM", "FLA", "LAK", "MIN", "MTL", "NJD",
     "NSH", "NYI", "NYR", "OTT", "PHI", "PIT", "SEA", "SJS",
     "STL", "TBL", "TOR", "UTA", "VAN", "VGK", "WPG", "WSH",
-]
+)
 
 
+@lru_cache(maxsize=1)
 def _client() -> Optional["NHLClient"]:
+    """Process-wide NHLClient, so its HTTP session and connection pool are reused across syncs."""
     if NHLClient is None:
         return None
     return NHLClient()
 
 
-def _fetch_json(path: str) -> Optional[Dict[str, Any]]:
+def _get_http_client() -> httpx.Client:
+    """Process-wide keep-alive client for the roster API, so every request shares its pool."""
+    global _http_client
+    client = _http_client
+    if client is None:
+        with _http_client_lock:
+            client = _http_client
+            if client is None:
+                limits = httpx.Limits(max_connections=100, max_keepalive_connections=32)
+                client = httpx.Client(
+                    timeout=30.0,
+                    limits=limits,
+                    transport=httpx.HTTPTransport(
+                        retries=ROSTER_MAX_RETRIES,
+                        limits=limits,
+                        http2=_HTTP2_AVAILABLE,
+                    ),
+                )
+                _http_client = client
+    return client
+
+
+def _get(http_client: httpx.Client, url: str, headers: Optional[Dict[str, str]]) -> httpx.Response:
+    """GET ``url``, retrying rate-limit and gateway errors on the same pooled client."""
+    for attempt in range(ROSTER_MAX_RETRIES):
+        response = http_client.get(url, headers=headers)
+        if response.status_code not in RETRY_STATUSES:
+            return response
+        delay = retry_delay(response, attempt)
+        logger.warning(f"Roster API returned {response.status_code} for {url}; retrying in {delay:.1f}s")
+        time.sleep(delay)
+    return http_client.get(url, headers=headers)
+
+
+def invalidate_cache() -> None:
+    """Drop every cached roster API response and remembered failure."""
+    with _response_cache_lock:
+        _response_cache.clear()
+        _failure_cache.clear()
+
+
+def _fetch_json(path: str, http_client: Optional[httpx.Client] = None) -> Optional[Dict[str, Any]]:
+    now = time.monotonic()
+    with _response_cache_lock:
+        cached = _response_cache.get(path)
+        failing_until = _failure_cache.get(path)
+    if cached is not None and now - cached[0] < ROSTER_CACHE_TTL_SECONDS:
+        return cached[2]
+    if failing_until is not None and now < failing_until:
+        return None
+
     url = f"{ROSTER_API_BASE}/{path}"
+    # An expired entry can still be revalidated instead of downloaded again.
+    headers = {"If-None-Match": cached[1]} if cached is not None and cached[1] else None
     try:
-        with httpx.Client(timeout=30.0) as client:
-            response = client.get(url)
+        response = _get(http_client or _get_http_client(), url, headers)
+        if response.status_code == 304 and cached is not None:
+            etag, payload = cached[1], cached[2]
+        else:
             response.raise_for_status()
-            return response.json()
+            payload = orjson.loads(response.content) if orjson is not None else response.json()
+            etag = response.headers.get("etag")
+        with _response_cache_lock:
+            _response_cache[path] = (time.monotonic(), etag, payload)
+            _failure_cache.pop(path, None)
+        return payload
+    except httpx.HTTPStatusError as exc:
+        status_code = exc.response.status_code
+        if status_code == 404 or status_code >= 500:
+            ttl = _NOT_FOUND_TTL_SECONDS if status_code == 404 else _SERVER_ERROR_TTL_SECONDS
+            with _response_cache_lock:
+                _failure_cache[path] = time.monotonic() + ttl
+        logger.error(f"Roster API error for {path}: {exc}")
+        return None
     except httpx.HTTPError as exc:
         logger.error(f"Roster API error for {path}: {exc}")
         return None
@@ -48,19 +159,22 @@ def _fetch_json(path: str) -> Optional[Dict[str, Any]]:
         return None
 
 
-def fetch_team_abbrevs(client: Optional["NHLClient"] = None) -> List[str]:
-    """Fetch NHL team abbreviations, falling back to a static list."""
-    teams_payload = None
-    if client is not None:
+def fetch_team_abbrevs(
+    client: Optional["NHLClient"] = None,
+    http_client: Optional[httpx.Client] = None,
+) -> List[str]:
+    """Fetch NHL team abbreviations, falling back to NHLClient and then a static list."""
+    if get_settings().nhl_roster_use_static_teams:
+        return list(FALLBACK_TEAM_ABBREVS)
+    # The cached, revalidated httpx path goes first; NHLClient only covers its failures.
+    teams_payload = _fetch_json("teams", http_client)
+    if not teams_payload and client is not None:
         try:
             teams_payload = client.teams.teams()
         except Exception as exc:
             logger.error(f"NHLClient teams error: {exc}")
-
     if not teams_payload:
-        teams_payload = _fetch_json("teams")
-    if not teams_payload:
-        return FALLBACK_TEAM_ABBREVS
+        return list(FALLBACK_TEAM_ABBREVS)
 
     if isinstance(teams_payload, dict):
         teams = teams_payload.get("teams") or teams_payload.get("data") or []
@@ -72,44 +186,48 @@ def fetch_team_abbrevs(client: Optional["NHLClient"] = None) -> List[str]:
         if isinstance(abbrev, str):
             abbrevs.append(abbrev.strip())
 
-    return sorted(set(abbrevs)) if abbrevs else FALLBACK_TEAM_ABBREVS
+    return sorted(set(abbrevs)) if abbrevs else list(FALLBACK_TEAM_ABBREVS)
 
 
 def fetch_team_roster(
     team_abbrev: str,
     season_id: str,
     client: Optional["NHLClient"] = None,
+    http_client: Optional[httpx.Client] = None,
 ) -> Dict[str, List[Dict[str, Any]]]:
-    """Fetch roster for a team and season."""
-    payload = None
-    if client is not None:
+    """Fetch roster for a team and season, via the cached roster API first and NHLClient second."""
+    payload = _fetch_json(f"roster/{team_abbrev}/{season_id}", http_client)
+    if not payload and client is not None:
         try:
             payload = client.teams.team_roster(team_abbr=team_abbrev, season=season_id)
         except Exception as exc:
             logger.error(f"NHLClient roster error for {team_abbrev}: {exc}")
-    if not payload:
-        payload = _fetch_json(f"roster/{team_abbrev}/{season_id}")
     if not payload:
         return {}
     return payload
 
 
+def iter_all_rosters(season_id: str) -> Iterator[Dict[str, Any]]:
+    """Yield roster entries for a season team by team, while later rosters are still being fetched."""
+    client = _client()
+    abbrevs = fetch_team_abbrevs(client)
+
+    def fetch(abbrev: str) -> Dict[str, List[Dict[str, Any]]]:
+        return fetch_team_roster(abbrev, season_id, client)
+
+    # Requests overlap on the shared pool; map yields in team order as the rosters complete.
+    with ThreadPoolExecutor(max_workers=ROSTER_FETCH_WORKERS) as executor:
+        for abbrev, roster in zip(abbrevs, executor.map(fetch, abbrevs)):
+            if not roster:
+                continue
+
+            # Payloads may be cached and shared, so each entry is a fresh dict rather than the player itself.
+            for group_key in _ROSTER_GROUPS:
+                for player in roster.get(group_key) or ():
+                    if isinstance(player, dict):
+                        yield {**player, "teamAbbrev": abbrev}
+
+
 def fetch_all_rosters(season_id: str) -> List[Dict[str, Any]]:
     """Fetch all team rosters for a season."""
-    client = _client()
-    roster_entries: List[Dict[str, Any]] = []
-    for abbrev in fetch_team_abbrevs(client):
-        roster = fetch_team_roster(abbrev, season_id, client)
-        if not roster:
-            continue
-
-        for group_key in ("forwards", "defensemen", "goalies", "skaters", "roster"):
-            players = roster.get(group_key) or []
-            for player in players:
-                if not isinstance(player, dict):
-                    continue
-                entry = dict(player)
-                entry["teamAbbrev"] = abbrev
-                roster_entries.append(entry)
-
-    return roster_entries
+    return list(iter_all_rosters(season_id))
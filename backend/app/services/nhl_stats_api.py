@@ -6,23 +6,58 @@ than the api-web.nhle.com endpoints (which lack hits, blocks, etc.)
 """
 
 import importlib
+import json
 import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime, timezone, timedelta, date
-from typing import Dict, List, Optional, Any, Union
+from datetime import datetime, timezone, date
+from functools import lru_cache, partial
+from importlib.util import find_spec
+from typing import Callable, Dict, List, Optional, Any, Union
 import httpx
 
+from app.config import get_settings
+from app.services.http_retry import RETRY_STATUSES, retry_delay
+
 try:
     from nhlpy import NHLClient
 except Exception:  # pragma: no cover - nhlpy may be missing in some environments
     NHLClient = None
 
+try:
+    import orjson
+except Exception:  # pragma: no cover - fall back to httpx's stdlib decoding
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 STATS_API_BASE = "https://api.nhle.com/stats/rest/en"
 MAX_PAGE_SIZE = 100  # API appears to cap results at 100 per request.
 MAX_STATS_OFFSET = 10000  # Stats API returns empty beyond ~10k rows per query.
 DEFAULT_GAME_WINDOW_DAYS = 7
+STATS_PAGE_WORKERS = 4  # Concurrent page requests once a query's total is known.
+STATS_WINDOW_WORKERS = 4  # Date windows fetched concurrently during a season backfill.
+# Requests in flight across every window, endpoint and page pool in the process.
+STATS_MAX_CONCURRENT_REQUESTS = 12
+# Retries per request: connection errors in the transport, throttling/gateway statuses
+# with backoff; an incomplete window is then refetched once before the backfill fails.
+STATS_MAX_RETRIES = 3
+STATS_WINDOW_ATTEMPTS = 2
+
+# One keep-alive client for every stats request in the process, so paging through
+# a season's windows reuses connections instead of handshaking per request.
+_http_client: Optional[httpx.Client] = None
+_http_client_lock = threading.Lock()
+_request_slots = threading.BoundedSemaphore(STATS_MAX_CONCURRENT_REQUESTS)
+
+# (endpoint, params) -> (ETag, raw body) for finished date windows, least recently used
+# first; bounded by NHL_STATS_ETAG_CACHE_MB of bodies in total.
+_etag_cache: "OrderedDict[tuple, tuple[str, bytes]]" = OrderedDict()
+_etag_cache_bytes = 0
+_etag_cache_lock = threading.Lock()
 
 
 def _client() -> Optional["NHLClient"]:
@@ -31,7 +66,46 @@ def _client() -> Optional["NHLClient"]:
     return NHLClient()
 
 
+def _get_http_client() -> httpx.Client:
+    global _http_client
+    client = _http_client
+    if client is None:
+        with _http_client_lock:
+            client = _http_client
+            if client is None:
+                limits = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+                client = httpx.Client(
+                    timeout=30.0,
+                    limits=limits,
+                    transport=httpx.HTTPTransport(
+                        retries=STATS_MAX_RETRIES,
+                        limits=limits,
+                        http2=find_spec("h2") is not None,
+                    ),
+                )
+                _http_client = client
+    return client
+
+
+def _get(url: str, params: Dict[str, Any], headers: Optional[Dict[str, str]]) -> httpx.Response:
+    """GET on the shared client within the process-wide request bound, retrying throttling."""
+    client = _get_http_client()
+    for attempt in range(STATS_MAX_RETRIES):
+        with _request_slots:
+            response = client.get(url, params=params, headers=headers)
+        if response.status_code not in RETRY_STATUSES:
+            return response
+        delay = retry_delay(response, attempt)
+        logger.warning(f"NHL Stats API returned {response.status_code} for {url}; retrying in {delay:.1f}s")
+        time.sleep(delay)
+    with _request_slots:
+        return client.get(url, params=params, headers=headers)
+
+
+@lru_cache(maxsize=None)
 def _get_nhlpy_attr(name: str) -> Optional[object]:
+    # Cached per name: a missing nhlpy would otherwise re-run the import machinery's
+    # path search on every query build.
     try:
         nhlpy = importlib.import_module("nhlpy")
     except Exception:
@@ -145,7 +219,7 @@ def _nhlpy_stats_call(
     return data if isinstance(data, list) else None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SkaterGameStats:
     """Skater per-game statistics from the NHL Stats API."""
     player_id: str
@@ -171,7 +245,7 @@ class SkaterGameStats:
     giveaways: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GoalieGameStats:
     """Goalie per-game statistics from the NHL Stats API."""
     player_id: str
@@ -191,10 +265,20 @@ class GoalieGameStats:
     toi_seconds: float
 
 
+@lru_cache(maxsize=4096)
 def _parse_date(date_str: Optional[str]) -> Optional[datetime]:
-    """Parse a date string from the API."""
+    """Parse a date string from the API.
+
+    Cached, since every player's row for a game carries the same date string.
+    """
     if not date_str:
         return None
+    # The API's usual "YYYY-MM-DD" skips strptime's format parsing.
+    if len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-":
+        try:
+            return datetime(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:]), tzinfo=timezone.utc)
+        except ValueError:
+            pass
     try:
         return datetime.strptime(date_str, "%Y-%m-%d").replace(tzinfo=timezone.utc)
     except ValueError:
@@ -211,16 +295,25 @@ def _parse_date(date_str: Optional[str]) -> Optional[datetime]:
 
 def _safe_int(value: Any, default: int = 0) -> int:
     """Safely convert a value to int."""
+    if value is None:
+        return default
+    # Decoded JSON numbers are already ints; skip the conversion entirely.
+    if type(value) is int:
+        return value
     try:
-        return int(value) if value is not None else default
+        return int(value)
     except (TypeError, ValueError):
         return default
 
 
 def _safe_float(value: Any, default: float = 0.0) -> float:
     """Safely convert a value to float."""
+    if value is None:
+        return default
+    if type(value) is float:
+        return value
     try:
-        return float(value) if value is not None else default
+        return float(value)
     except (TypeError, ValueError):
         return default
 
@@ -232,37 +325,166 @@ def _parse_toi_seconds(value: Any) -> float:
     if isinstance(value, (int, float)):
         return float(value)
     if isinstance(value, str):
-        if ":" in value:
-            parts = value.split(":")
-            try:
-                if len(parts) == 2:
-                    minutes, seconds = parts
-                    return float(minutes) * 60 + float(seconds)
-                if len(parts) == 3:
-                    hours, minutes, seconds = parts
-                    return float(hours) * 3600 + float(minutes) * 60 + float(seconds)
-            except ValueError:
-                return 0.0
-        return _safe_float(value, default=0.0)
+        return _parse_toi_str(value)
     return 0.0
 
 
+@lru_cache(maxsize=4096)
+def _parse_toi_str(value: str) -> float:
+    """Parse a "MM:SS" / "HH:MM:SS" time-on-ice string; cached since TOI values repeat."""
+    if ":" in value:
+        parts = value.split(":")
+        try:
+            if len(parts) == 2:
+                minutes, seconds = parts
+                return float(minutes) * 60 + float(seconds)
+            if len(parts) == 3:
+                hours, minutes, seconds = parts
+                return float(hours) * 3600 + float(minutes) * 60 + float(seconds)
+        except ValueError:
+            return 0.0
+    return _safe_float(value, default=0.0)
+
+
+class StatsFetchError(RuntimeError):
+    """A stats API page could not be fetched, or a paged query came back incomplete."""
+
+
 def _fetch_stats(endpoint: str, params: Dict[str, Any]) -> List[Dict]:
-    """Fetch data from the NHL Stats API."""
+    """Fetch data from the NHL Stats API; failures are logged and yield no rows."""
+    try:
+        return _fetch_stats_page(endpoint, params)[0]
+    except StatsFetchError as e:
+        logger.error(str(e))
+        return []
+
+
+def invalidate_etag_cache() -> None:
+    """Drop every remembered stats API response body."""
+    global _etag_cache_bytes
+    with _etag_cache_lock:
+        _etag_cache.clear()
+        _etag_cache_bytes = 0
+
+
+def _remember_page(cache_key: tuple, etag: str, body: bytes) -> None:
+    global _etag_cache_bytes
+    max_bytes = get_settings().nhl_stats_etag_cache_mb * 1024 * 1024
+    if len(body) > max_bytes:
+        return
+    with _etag_cache_lock:
+        previous = _etag_cache.pop(cache_key, None)
+        if previous is not None:
+            _etag_cache_bytes -= len(previous[1])
+        _etag_cache[cache_key] = (etag, body)
+        _etag_cache_bytes += len(body)
+        while _etag_cache_bytes > max_bytes:
+            _, (_, evicted) = _etag_cache.popitem(last=False)
+            _etag_cache_bytes -= len(evicted)
+
+
+def _fetch_stats_page(
+    endpoint: str,
+    params: Dict[str, Any],
+    cacheable: bool = False,
+) -> tuple[List[Dict], Optional[int]]:
+    """
+    Fetch one page from the NHL Stats API, with the query's reported total row count.
+
+    Raises StatsFetchError when the request or its decoding fails, so paged callers
+    can tell a failed page from an empty one. ``cacheable`` pages (finished date
+    windows, which rarely change) are revalidated by ETag instead of downloaded again.
+    """
     url = f"{STATS_API_BASE}/{endpoint}"
+    cache_key = (endpoint, tuple(sorted(params.items())))
+    cached = None
+    if cacheable:
+        with _etag_cache_lock:
+            cached = _etag_cache.get(cache_key)
+    headers = {"If-None-Match": cached[0]} if cached is not None else None
 
     try:
-        with httpx.Client(timeout=30.0) as client:
-            response = client.get(url, params=params)
+        response = _get(url, params, headers)
+        if response.status_code == 304 and cached is not None:
+            body = cached[1]
+            with _etag_cache_lock:
+                if cache_key in _etag_cache:
+                    _etag_cache.move_to_end(cache_key)
+        else:
             response.raise_for_status()
-            data = response.json()
-            return data.get("data", [])
+            body = response.content
+            etag = response.headers.get("etag")
+            if cacheable and etag:
+                _remember_page(cache_key, etag, body)
+        data = orjson.loads(body) if orjson is not None else json.loads(body)
+        total = data.get("total")
+        return data.get("data", []), total if isinstance(total, int) else None
     except httpx.HTTPError as e:
-        logger.error(f"NHL Stats API error for {endpoint}: {e}")
-        return []
+        raise StatsFetchError(f"NHL Stats API error for {endpoint}: {e}") from e
     except Exception as e:
-        logger.error(f"Unexpected error fetching {endpoint}: {e}")
-        return []
+        raise StatsFetchError(f"Unexpected error fetching {endpoint}: {e}") from e
+
+
+def _fetch_stats_paged(endpoint: str, params: Dict[str, Any], cacheable: bool = False) -> List[Dict]:
+    """
+    Fetch every page of a stats query.
+
+    The first page reports the query's total, so the remaining pages are requested
+    concurrently and concatenated in offset order. A page that comes back shorter
+    than the total implies is requested once more, then StatsFetchError is raised
+    rather than returning the query with a hole in it. When no total comes back
+    the pages are walked one at a time until a short page.
+    """
+    batch_size = params["limit"]
+    rows, total = _fetch_stats_page(endpoint, {**params, "start": 0}, cacheable)
+
+    if total is not None:
+        expected = min(total, MAX_STATS_OFFSET)
+
+        def complete_page(offset: int, page: Optional[List[Dict]] = None) -> List[Dict]:
+            page_params = {**params, "start": offset}
+            page_size = min(batch_size, expected - offset)
+            if page is None:
+                page = _fetch_stats_page(endpoint, page_params, cacheable)[0]
+            if len(page) < page_size:
+                page = _fetch_stats_page(endpoint, page_params, cacheable)[0]
+            if len(page) < page_size:
+                raise StatsFetchError(
+                    f"Stats query {endpoint} ({params.get('cayenneExp')}) returned "
+                    f"{len(page)} of {page_size} rows at offset {offset}"
+                )
+            return page
+
+        rows = complete_page(0, rows)
+        offsets = range(batch_size, expected, batch_size)
+        if offsets:
+            with ThreadPoolExecutor(max_workers=STATS_PAGE_WORKERS) as executor:
+                for page in executor.map(complete_page, offsets):
+                    rows.extend(page)
+        capped = total > MAX_STATS_OFFSET
+    else:
+        if len(rows) < batch_size:
+            return rows
+        offset = batch_size
+        capped = False
+        while True:
+            if offset >= MAX_STATS_OFFSET:
+                capped = True
+                break
+            page = _fetch_stats_page(endpoint, {**params, "start": offset}, cacheable)[0]
+            rows.extend(page)
+            if len(page) < batch_size:
+                break
+            offset += batch_size
+
+    if capped:
+        logger.warning(
+            "Stats query %s (%s) hit stats API offset cap (%s).",
+            endpoint,
+            params.get("cayenneExp"),
+            MAX_STATS_OFFSET,
+        )
+    return rows
 
 
 def _game_cayenne_exp(
@@ -278,10 +500,8 @@ def _game_cayenne_exp(
     if player_id:
         parts.append(f"playerId={player_id}")
     if start_date and end_date:
-        start_value = start_date.strftime("%Y-%m-%d")
-        end_value = end_date.strftime("%Y-%m-%d")
-        parts.append(f"gameDate>='{start_value}'")
-        parts.append(f"gameDate<='{end_value}'")
+        parts.append(f"gameDate>='{start_date.date().isoformat()}'")
+        parts.append(f"gameDate<='{end_date.date().isoformat()}'")
     return " and ".join(parts)
 
 
@@ -300,30 +520,54 @@ def _date_windows(
     end_date: datetime,
     window_days: int = DEFAULT_GAME_WINDOW_DAYS,
 ) -> List[tuple[datetime, datetime]]:
+    # Step over day ordinals and build each bound once, keeping start_date's time of day.
     windows: List[tuple[datetime, datetime]] = []
-    current = start_date
-    while current <= end_date:
-        window_end = min(current + timedelta(days=window_days - 1), end_date)
-        windows.append((current, window_end))
-        current = window_end + timedelta(days=1)
+    time_of_day = start_date.timetz()
+    end_ordinal = end_date.toordinal()
+    for first in range(start_date.toordinal(), end_ordinal + 1, window_days):
+        window_start = datetime.combine(date.fromordinal(first), time_of_day)
+        if window_start > end_date:
+            break
+        window_end = datetime.combine(date.fromordinal(first + window_days - 1), time_of_day)
+        windows.append((window_start, min(window_end, end_date)))
     return windows
 
 
-def _build_realtime_indexes(realtime_data: List[Dict[str, Any]]) -> tuple[Dict[tuple, Dict], Dict[tuple, Dict]]:
+class _RealtimeDateIndex:
+    """(player id, game date) -> realtime row, built on the first lookup.
+
+    Realtime rows nearly always match by game id, so most windows never need it.
+    """
+
+    def __init__(self, realtime_data: List[Dict[str, Any]]) -> None:
+        self._realtime_data = realtime_data
+        self._by_date: Optional[Dict[tuple, Dict]] = None
+
+    def get(self, key: tuple, default: Any = None) -> Any:
+        by_date = self._by_date
+        if by_date is None:
+            by_date = {}
+            for entry in self._realtime_data:
+                player_id = entry.get("playerId")
+                if player_id is None:
+                    continue
+                game_date = _normalize_game_date(entry.get("gameDate") or entry.get("gameDateUTC"))
+                if game_date:
+                    by_date[(str(player_id), game_date)] = entry
+            self._by_date = by_date
+        return by_date.get(key, default)
+
+
+def _build_realtime_indexes(
+    realtime_data: List[Dict[str, Any]],
+) -> tuple[Dict[tuple, Dict], _RealtimeDateIndex]:
     by_game: Dict[tuple, Dict] = {}
-    by_date: Dict[tuple, Dict] = {}
     for entry in realtime_data:
         player_id = entry.get("playerId")
-        if player_id is None:
-            continue
-        player_id_str = str(player_id)
         game_id = entry.get("gameId")
-        if game_id is not None:
-            by_game[(player_id_str, str(game_id))] = entry
-        game_date = _normalize_game_date(entry.get("gameDate") or entry.get("gameDateUTC"))
-        if game_date:
-            by_date[(player_id_str, game_date)] = entry
-    return by_game, by_date
+        if player_id is not None and game_id is not None:
+            by_game[(str(player_id), str(game_id))] = entry
+    return by_game, _RealtimeDateIndex(realtime_data)
 
 
 def _normalize_game_date(value: Any) -> Optional[str]:
@@ -334,20 +578,108 @@ def _normalize_game_date(value: Any) -> Optional[str]:
     if isinstance(value, date):
         return value.isoformat()
     if isinstance(value, str):
-        cleaned = value.strip()
-        if not cleaned:
-            return None
-        if "T" in cleaned:
-            cleaned = cleaned.split("T")[0]
-        if "Z" in cleaned:
-            cleaned = cleaned.replace("Z", "")
-        try:
-            return datetime.fromisoformat(cleaned).date().isoformat()
-        except ValueError:
-            return cleaned
+        return _normalize_date_str(value)
     return None
 
 
+@lru_cache(maxsize=8192)
+def _normalize_date_str(value: str) -> Optional[str]:
+    # Realtime rows repeat the same few game dates, so each distinct string is parsed once.
+    cleaned = value.strip()
+    if not cleaned:
+        return None
+    if "T" in cleaned:
+        cleaned = cleaned.split("T")[0]
+    if "Z" in cleaned:
+        cleaned = cleaned.replace("Z", "")
+    try:
+        return datetime.fromisoformat(cleaned).date().isoformat()
+    except ValueError:
+        return cleaned
+
+
+def _build_skater_row(
+    entry: Dict[str, Any],
+    realtime_index: Dict[tuple, Dict],
+    realtime_by_date: _RealtimeDateIndex,
+) -> Optional[SkaterGameStats]:
+    """Merge a skater summary row with its realtime (peripherals) row."""
+    get = entry.get
+    game_date = _parse_date(get("gameDate"))
+    if not game_date:
+        return None
+
+    player_id_str = str(get("playerId"))
+    game_id_str = str(get("gameId"))
+
+    # Get peripheral stats from realtime data
+    realtime = realtime_index.get((player_id_str, game_id_str), {})
+    if not realtime:
+        normalized_date = _normalize_game_date(get("gameDate") or get("gameDateUTC"))
+        if normalized_date:
+            realtime = realtime_by_date.get((player_id_str, normalized_date), {})
+    realtime_get = realtime.get
+
+    return SkaterGameStats(
+        player_id=player_id_str,
+        game_id=game_id_str,
+        game_date=game_date,
+        team=get("teamAbbrev", ""),
+        opponent=get("opponentTeamAbbrev", ""),
+        is_home=get("homeRoad") == "H",
+        # Scoring stats from summary
+        goals=_safe_int(get("goals")),
+        assists=_safe_int(get("assists")),
+        points=_safe_int(get("points")),
+        shots=_safe_int(get("shots")),
+        plus_minus=_safe_int(get("plusMinus")),
+        pim=_safe_int(get("penaltyMinutes") or get("pim")),
+        pp_points=_safe_int(get("ppPoints") or get("powerPlayPoints")),
+        sh_points=_safe_int(get("shPoints") or get("shorthandedPoints")),
+        toi_seconds=_parse_toi_seconds(get("timeOnIce") or get("timeOnIcePerGame")),
+        # Peripheral stats from realtime
+        hits=_safe_int(realtime_get("hits") or get("hits")),
+        blocks=_safe_int(
+            realtime_get("blockedShots")
+            or realtime_get("blocks")
+            or get("blockedShots")
+            or get("blocks")
+        ),
+        takeaways=_safe_int(realtime_get("takeaways") or get("takeaways")),
+        giveaways=_safe_int(realtime_get("giveaways") or get("giveaways")),
+    )
+
+
+def _build_goalie_row(entry: Dict[str, Any]) -> Optional[GoalieGameStats]:
+    """Build a goalie game row from a goalie summary row."""
+    get = entry.get
+    game_date = _parse_date(get("gameDate"))
+    if not game_date:
+        return None
+
+    return GoalieGameStats(
+        player_id=str(get("playerId")),
+        game_id=str(get("gameId")),
+        game_date=game_date,
+        team=get("teamAbbrev", ""),
+        opponent=get("opponentTeamAbbrev", ""),
+        is_home=get("homeRoad") == "H",
+        saves=_safe_int(get("saves")),
+        shots_against=_safe_int(get("shotsAgainst")),
+        goals_against=_safe_int(get("goalsAgainst")),
+        save_pct=_safe_float(
+            get("savePct")
+            or get("savePctg")
+            or get("savePercentage")
+        ),
+        wins=_safe_int(get("wins")),
+        losses=_safe_int(get("losses")),
+        ot_losses=_safe_int(get("otLosses")),
+        shutouts=_safe_int(get("shutouts")),
+        toi_seconds=_parse_toi_seconds(get("timeOnIce")),
+    )
+
+
 def fetch_skater_game_stats(
     season_id: str,
     player_id: Optional[str] = None,
@@ -411,50 +743,8 @@ def fetch_skater_game_stats(
 
     # Merge the data
     results: List[SkaterGameStats] = []
-    for entry in summary_data:
-        player_id_str = str(entry.get("playerId"))
-        game_id_str = str(entry.get("gameId"))
-        game_date = _parse_date(entry.get("gameDate"))
-
-        if not game_date:
-            continue
-
-        # Get peripheral stats from realtime data
-        key = (player_id_str, game_id_str)
-        realtime = realtime_index.get(key, {})
-        if not realtime:
-            normalized_date = _normalize_game_date(entry.get("gameDate") or entry.get("gameDateUTC"))
-            if normalized_date:
-                realtime = realtime_by_date.get((player_id_str, normalized_date), {})
-
-        results.append(SkaterGameStats(
-            player_id=player_id_str,
-            game_id=game_id_str,
-            game_date=game_date,
-            team=entry.get("teamAbbrev", ""),
-            opponent=entry.get("opponentTeamAbbrev", ""),
-            is_home=entry.get("homeRoad") == "H",
-            # Scoring stats from summary
-            goals=_safe_int(entry.get("goals")),
-            assists=_safe_int(entry.get("assists")),
-            points=_safe_int(entry.get("points")),
-            shots=_safe_int(entry.get("shots")),
-            plus_minus=_safe_int(entry.get("plusMinus")),
-            pim=_safe_int(entry.get("penaltyMinutes") or entry.get("pim")),
-            pp_points=_safe_int(entry.get("ppPoints") or entry.get("powerPlayPoints")),
-            sh_points=_safe_int(entry.get("shPoints") or entry.get("shorthandedPoints")),
-            toi_seconds=_parse_toi_seconds(entry.get("timeOnIce") or entry.get("timeOnIcePerGame")),
-            # Peripheral stats from realtime
-            hits=_safe_int(realtime.get("hits") or entry.get("hits")),
-            blocks=_safe_int(
-                realtime.get("blockedShots")
-                or realtime.get("blocks")
-                or entry.get("blockedShots")
-                or entry.get("blocks")
-            ),
-            takeaways=_safe_int(realtime.get("takeaways") or entry.get("takeaways")),
-            giveaways=_safe_int(realtime.get("giveaways") or entry.get("giveaways")),
-        ))
+    rows = (_build_skater_row(entry, realtime_index, realtime_by_date) for entry in summary_data)
+    results.extend(row for row in rows if row is not None)
 
     logger.info(f"Fetched {len(results)} skater game stats for season {season_id}")
     return results
@@ -501,37 +791,17 @@ def fetch_goalie_game_stats(
         data = _fetch_stats("goalie/summary", params)
 
     results: List[GoalieGameStats] = []
-    for entry in data:
-        game_date = _parse_date(entry.get("gameDate"))
-        if not game_date:
-            continue
-
-        results.append(GoalieGameStats(
-            player_id=str(entry.get("playerId")),
-            game_id=str(entry.get("gameId")),
-            game_date=game_date,
-            team=entry.get("teamAbbrev", ""),
-            opponent=entry.get("opponentTeamAbbrev", ""),
-            is_home=entry.get("homeRoad") == "H",
-            saves=_safe_int(entry.get("saves")),
-            shots_against=_safe_int(entry.get("shotsAgainst")),
-            goals_against=_safe_int(entry.get("goalsAgainst")),
-            save_pct=_safe_float(
-                entry.get("savePct")
-                or entry.get("savePctg")
-                or entry.get("savePercentage")
-            ),
-            wins=_safe_int(entry.get("wins")),
-            losses=_safe_int(entry.get("losses")),
-            ot_losses=_safe_int(entry.get("otLosses")),
-            shutouts=_safe_int(entry.get("shutouts")),
-            toi_seconds=_parse_toi_seconds(entry.get("timeOnIce")),
-        ))
+    results.extend(row for row in map(_build_goalie_row, data) if row is not None)
 
     logger.info(f"Fetched {len(results)} goalie game stats for season {season_id}")
     return results
 
 
+def _window_finished(end_date: datetime) -> bool:
+    """Whether a date window ended before today (UTC), so its pages are worth caching."""
+    return end_date.date() < datetime.now(timezone.utc).date()
+
+
 def _fetch_skater_game_stats_window(
     season_id: str,
     game_type: Optional[int],
@@ -539,81 +809,33 @@ def _fetch_skater_game_stats_window(
     end_date: datetime,
 ) -> List[SkaterGameStats]:
     results: List[SkaterGameStats] = []
-    offset = 0
-    batch_size = MAX_PAGE_SIZE
     cayenne_exp = _game_cayenne_exp(
         season_id=season_id,
         game_type=game_type,
         start_date=start_date,
         end_date=end_date,
     )
+    params = {
+        "isAggregate": "false",
+        "isGame": "true",
+        "limit": MAX_PAGE_SIZE,
+        "cayenneExp": cayenne_exp,
+    }
+    cacheable = _window_finished(end_date)
 
-    while True:
-        params = {
-            "isAggregate": "false",
-            "isGame": "true",
-            "limit": batch_size,
-            "start": offset,
-            "cayenneExp": cayenne_exp,
-        }
-        summary_data = _fetch_stats("skater/summary", params)
+    # The window's summary and realtime rows are fetched side by side on the shared client.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        realtime_future = executor.submit(_fetch_stats_paged, "skater/realtime", params, cacheable)
+        summary_data = _fetch_stats_paged("skater/summary", params, cacheable)
         if not summary_data:
-            break
-
-        realtime_data = _fetch_stats("skater/realtime", params)
-        realtime_index, realtime_by_date = _build_realtime_indexes(realtime_data)
+            realtime_future.cancel()
+            return results
+        realtime_data = realtime_future.result()
 
-        for entry in summary_data:
-            player_id_str = str(entry.get("playerId"))
-            game_id_str = str(entry.get("gameId"))
-            game_date = _parse_date(entry.get("gameDate"))
-            if not game_date:
-                continue
+    realtime_index, realtime_by_date = _build_realtime_indexes(realtime_data)
 
-            realtime = realtime_index.get((player_id_str, game_id_str), {})
-            if not realtime:
-                normalized_date = _normalize_game_date(entry.get("gameDate") or entry.get("gameDateUTC"))
-                if normalized_date:
-                    realtime = realtime_by_date.get((player_id_str, normalized_date), {})
-
-            results.append(SkaterGameStats(
-                player_id=player_id_str,
-                game_id=game_id_str,
-                game_date=game_date,
-                team=entry.get("teamAbbrev", ""),
-                opponent=entry.get("opponentTeamAbbrev", ""),
-                is_home=entry.get("homeRoad") == "H",
-                goals=_safe_int(entry.get("goals")),
-                assists=_safe_int(entry.get("assists")),
-                points=_safe_int(entry.get("points")),
-                shots=_safe_int(entry.get("shots")),
-                plus_minus=_safe_int(entry.get("plusMinus")),
-                pim=_safe_int(entry.get("penaltyMinutes") or entry.get("pim")),
-                pp_points=_safe_int(entry.get("ppPoints") or entry.get("powerPlayPoints")),
-                sh_points=_safe_int(entry.get("shPoints") or entry.get("shorthandedPoints")),
-                toi_seconds=_parse_toi_seconds(entry.get("timeOnIce") or entry.get("timeOnIcePerGame")),
-                hits=_safe_int(realtime.get("hits") or entry.get("hits")),
-                blocks=_safe_int(
-                    realtime.get("blockedShots")
-                    or realtime.get("blocks")
-                    or entry.get("blockedShots")
-                    or entry.get("blocks")
-                ),
-                takeaways=_safe_int(realtime.get("takeaways") or entry.get("takeaways")),
-                giveaways=_safe_int(realtime.get("giveaways") or entry.get("giveaways")),
-            ))
-
-        if len(summary_data) < batch_size:
-            break
-        offset += batch_size
-        if offset >= MAX_STATS_OFFSET:
-            logger.warning(
-                "Skater window %s to %s hit stats API offset cap (%s).",
-                start_date.date(),
-                end_date.date(),
-                MAX_STATS_OFFSET,
-            )
-            break
+    rows = (_build_skater_row(entry, realtime_index, realtime_by_date) for entry in summary_data)
+    results.extend(row for row in rows if row is not None)
 
     return results
 
@@ -625,67 +847,46 @@ def _fetch_goalie_game_stats_window(
     end_date: datetime,
 ) -> List[GoalieGameStats]:
     results: List[GoalieGameStats] = []
-    offset = 0
-    batch_size = MAX_PAGE_SIZE
     cayenne_exp = _game_cayenne_exp(
         season_id=season_id,
         game_type=game_type,
         start_date=start_date,
         end_date=end_date,
     )
+    params = {
+        "isAggregate": "false",
+        "isGame": "true",
+        "limit": MAX_PAGE_SIZE,
+        "cayenneExp": cayenne_exp,
+    }
+    goalie_data = _fetch_stats_paged("goalie/summary", params, _window_finished(end_date))
 
-    while True:
-        params = {
-            "isAggregate": "false",
-            "isGame": "true",
-            "limit": batch_size,
-            "start": offset,
-            "cayenneExp": cayenne_exp,
-        }
-        goalie_data = _fetch_stats("goalie/summary", params)
-        if not goalie_data:
-            break
+    results.extend(row for row in map(_build_goalie_row, goalie_data) if row is not None)
 
-        for entry in goalie_data:
-            game_date = _parse_date(entry.get("gameDate"))
-            if not game_date:
-                continue
+    return results
 
-            results.append(GoalieGameStats(
-                player_id=str(entry.get("playerId")),
-                game_id=str(entry.get("gameId")),
-                game_date=game_date,
-                team=entry.get("teamAbbrev", ""),
-                opponent=entry.get("opponentTeamAbbrev", ""),
-                is_home=entry.get("homeRoad") == "H",
-                saves=_safe_int(entry.get("saves")),
-                shots_against=_safe_int(entry.get("shotsAgainst")),
-                goals_against=_safe_int(entry.get("goalsAgainst")),
-                save_pct=_safe_float(
-                    entry.get("savePct")
-                    or entry.get("savePctg")
-                    or entry.get("savePercentage")
-                ),
-                wins=_safe_int(entry.get("wins")),
-                losses=_safe_int(entry.get("losses")),
-                ot_losses=_safe_int(entry.get("otLosses")),
-                shutouts=_safe_int(entry.get("shutouts")),
-                toi_seconds=_parse_toi_seconds(entry.get("timeOnIce")),
-            ))
-
-        if len(goalie_data) < batch_size:
-            break
-        offset += batch_size
-        if offset >= MAX_STATS_OFFSET:
+
+def _fetch_window(
+    fetch_window: Callable[[str, Optional[int], datetime, datetime], list],
+    season_id: str,
+    game_type: Optional[int],
+    start_date: datetime,
+    end_date: datetime,
+) -> list:
+    """Run one window fetch, refetching the whole window if it came back incomplete."""
+    for attempt in range(1, STATS_WINDOW_ATTEMPTS + 1):
+        try:
+            return fetch_window(season_id, game_type, start_date, end_date)
+        except StatsFetchError as exc:
+            if attempt == STATS_WINDOW_ATTEMPTS:
+                raise
             logger.warning(
-                "Goalie window %s to %s hit stats API offset cap (%s).",
+                "Refetching stats window %s to %s after an incomplete fetch: %s",
                 start_date.date(),
                 end_date.date(),
-                MAX_STATS_OFFSET,
+                exc,
             )
-            break
-
-    return results
+    return []
 
 
 def fetch_all_game_stats(
@@ -695,7 +896,8 @@ def fetch_all_game_stats(
     """
     Fetch all player game stats for a season.
 
-    Returns a tuple of (skater_stats, goalie_stats).
+    Returns a tuple of (skater_stats, goalie_stats). Raises StatsFetchError when a
+    window stays incomplete after a refetch, rather than returning partial rows.
     """
     all_skater_stats: List[SkaterGameStats] = []
     all_goalie_stats: List[GoalieGameStats] = []
@@ -709,23 +911,29 @@ def fetch_all_game_stats(
         end_date.date(),
     )
 
-    for window_start, window_end in windows:
-        all_skater_stats.extend(
-            _fetch_skater_game_stats_window(
-                season_id=season_id,
-                game_type=game_type,
-                start_date=window_start,
-                end_date=window_end,
+    # Windows are independent queries, so they run concurrently; map keeps them in date order.
+    starts = [window_start for window_start, _ in windows]
+    ends = [window_end for _, window_end in windows]
+    with ThreadPoolExecutor(max_workers=STATS_WINDOW_WORKERS) as executor:
+        try:
+            skater_windows = executor.map(
+                partial(_fetch_window, _fetch_skater_game_stats_window, season_id, game_type),
+                starts,
+                ends,
             )
-        )
-        all_goalie_stats.extend(
-            _fetch_goalie_game_stats_window(
-                season_id=season_id,
-                game_type=game_type,
-                start_date=window_start,
-                end_date=window_end,
+            goalie_windows = executor.map(
+                partial(_fetch_window, _fetch_goalie_game_stats_window, season_id, game_type),
+                starts,
+                ends,
             )
-        )
+            for rows in skater_windows:
+                all_skater_stats.extend(rows)
+            for rows in goalie_windows:
+                all_goalie_stats.extend(rows)
+        except StatsFetchError:
+            # The backfill is failing anyway; don't start the windows still queued.
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
 
     logger.info(f"Total: {len(all_skater_stats)} skater games, {len(all_goalie_stats)} goalie games")
     return all_skater_stats, all_goalie_stats
@@ -750,15 +958,17 @@ def fetch_skater_game_stats_range(
 
     windows = _date_windows(start_date, end_date, DEFAULT_GAME_WINDOW_DAYS)
     results: List[SkaterGameStats] = []
-    for window_start, window_end in windows:
-        results.extend(
-            _fetch_skater_game_stats_window(
-                season_id=season_id,
-                game_type=game_type,
-                start_date=window_start,
-                end_date=window_end,
-            )
-        )
+    with ThreadPoolExecutor(max_workers=STATS_WINDOW_WORKERS) as executor:
+        try:
+            for rows in executor.map(
+                partial(_fetch_window, _fetch_skater_game_stats_window, season_id, game_type),
+                [window_start for window_start, _ in windows],
+                [window_end for _, window_end in windows],
+            ):
+                results.extend(rows)
+        except StatsFetchError:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
     return results
 
 
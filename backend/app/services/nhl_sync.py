@@ -27,10 +27,10 @@ from app.services.nhl_stats_api import (
     fetch_skater_game_stats_range,
     fetch_skater_season_summaries,
 )
-from app.services.nhl_roster_api import fetch_all_rosters
+from app.services.nhl_roster_api import iter_all_rosters
 from app.services.scan_evaluator import ScanEvaluatorService
 from app.services.season import current_season_id, season_id_for_date, current_game_type
-from app.services.streamer_score_config import get_default_streamer_score_config
+from app.services.streamer_score_config import DEFAULT_STREAMER_SCORE_CONFIG
 from app.services.yahoo_oauth_service import has_yahoo_credentials
 from app.services.yahoo_service import update_player_ownership
 
@@ -208,7 +208,7 @@ def _streamer_score_for_skater(
         bpg=bpg,
         trend="stable",
         ownership=0.0,
-        score_config=get_default_streamer_score_config(),
+        score_config=DEFAULT_STREAMER_SCORE_CONFIG,
     )
 
 
@@ -223,7 +223,7 @@ def _streamer_score_for_goalie(save_pct: float, gaa: float, wins: float, games:
         int(games),
         "stable",
         0.0,
-        score_config=get_default_streamer_score_config(),
+        score_config=DEFAULT_STREAMER_SCORE_CONFIG,
     )
 
 
@@ -336,9 +336,8 @@ def sync_players(db: Session, season_id: Optional[str] = None) -> int:
     run = _start_sync_run(db, "players")
 
     try:
-        roster_entries = fetch_all_rosters(season_id)
         roster_snapshots: dict[str, PlayerSnapshot] = {}
-        for entry in roster_entries:
+        for entry in iter_all_rosters(season_id):
             snapshot = _roster_snapshot(entry)
             if snapshot:
                 roster_snapshots[snapshot.external_id] = snapshot
@@ -997,7 +996,7 @@ def sync_player_game_log(db: Session, player: Player, season_id: Optional[str] =
 def needs_game_log_sync(db: Session, player: Player) -> bool:
     if not player.external_id:
         return False
-    latest = db.query(PlayerGameStats).filter(
+    latest = db.query(PlayerGameStats.date).filter(
         PlayerGameStats.player_id == player.id
     ).order_by(PlayerGameStats.date.desc()).first()
     if not latest:
@@ -1749,7 +1748,7 @@ def _maybe_run_nightly_sync(db: Session, season_id: str) -> None:
         # 2. Update rolling stats for all players
         try:
             rolling_run = _start_sync_run(db, "rolling_stats")
-            rolling_stats_count = AnalyticsService.update_all_rolling_stats(db)
+            rolling_stats_count = AnalyticsService.update_all_rolling_stats(db, skip_unchanged=True)
             logger.info(f"Updated {rolling_stats_count} rolling stats entries")
             _set_sync_state(db, "rolling_stats", now)
             _finish_sync_run(db, rolling_run, "success", rolling_stats_count)
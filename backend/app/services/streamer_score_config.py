@@ -82,6 +82,11 @@ DEFAULT_STREAMER_SCORE_CONFIG: dict[str, Any] = {
 }
 
 
+# Stored JSON of the last config loaded or saved, and its sanitized form, so an
+# unchanged stored value is not parsed and sanitized again. Callers get copies.
+_loaded_config: tuple[str, dict[str, Any]] | None = None
+
+
 def get_default_streamer_score_config() -> dict[str, Any]:
     return copy.deepcopy(DEFAULT_STREAMER_SCORE_CONFIG)
 
@@ -139,6 +144,7 @@ def sanitize_streamer_score_config(payload: Any) -> dict[str, Any]:
 
 
 def get_streamer_score_config(db: Session) -> dict[str, Any]:
+    global _loaded_config
     row = db.query(AppSetting).filter(AppSetting.key == STREAMER_SCORE_CONFIG_KEY).first()
     if not row:
         defaults = get_default_streamer_score_config()
@@ -152,21 +158,29 @@ def get_streamer_score_config(db: Session) -> dict[str, Any]:
         db.commit()
         return defaults
 
+    value_json = row.value_json
+    loaded = _loaded_config
+    if loaded is not None and loaded[0] == value_json:
+        return copy.deepcopy(loaded[1])
+
     try:
-        raw = json.loads(row.value_json)
+        raw = json.loads(value_json)
     except json.JSONDecodeError:
         raw = {}
 
     sanitized = sanitize_streamer_score_config(raw)
     if sanitized != raw:
-        row.value_json = json.dumps(sanitized, separators=(",", ":"))
+        value_json = json.dumps(sanitized, separators=(",", ":"))
+        row.value_json = value_json
         row.updated_at = datetime.utcnow()
         db.add(row)
         db.commit()
-    return sanitized
+    _loaded_config = (value_json, sanitized)
+    return copy.deepcopy(sanitized)
 
 
 def save_streamer_score_config(db: Session, payload: Any) -> dict[str, Any]:
+    global _loaded_config
     sanitized = sanitize_streamer_score_config(payload)
     row = db.query(AppSetting).filter(AppSetting.key == STREAMER_SCORE_CONFIG_KEY).first()
     encoded = json.dumps(sanitized, separators=(",", ":"))
@@ -181,4 +195,5 @@ def save_streamer_score_config(db: Session, payload: Any) -> dict[str, Any]:
         )
     db.add(row)
     db.commit()
-    return sanitized
+    _loaded_config = (encoded, sanitized)
+    return copy.deepcopy(sanitized)
@@ -0,0 +1,66 @@
+import httpx
+import pytest
+
+from app.services import nhl_stats_api
+
+SUMMARY_URL = f"{nhl_stats_api.STATS_API_BASE}/skater/summary"
+
+
+@pytest.fixture
+def stats_api(monkeypatch):
+    """Route the shared stats client through a mock transport serving queued responses."""
+    responses: list[httpx.Response] = []
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return responses.pop(0)
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(nhl_stats_api, "_http_client", client)
+    monkeypatch.setattr(nhl_stats_api.time, "sleep", lambda _seconds: None)
+    yield responses, requests
+    client.close()
+
+
+def test_get_sends_every_request(stats_api):
+    responses, requests = stats_api
+    responses.extend([httpx.Response(200, json={"data": []}), httpx.Response(500)])
+    params = {"limit": 100, "start": 0}
+
+    assert nhl_stats_api._get(SUMMARY_URL, params, None).status_code == 200
+    # Same arguments again: the second response must come from the server, not a cache.
+    assert nhl_stats_api._get(SUMMARY_URL, params, {"If-None-Match": "abc"}).status_code == 500
+    assert len(requests) == 2
+    assert requests[1].headers["if-none-match"] == "abc"
+
+
+def test_get_retries_throttled_responses(stats_api):
+    responses, requests = stats_api
+    responses.extend([
+        httpx.Response(429, headers={"Retry-After": "1"}),
+        httpx.Response(503),
+        httpx.Response(200, json={"data": []}),
+    ])
+
+    assert nhl_stats_api._get(SUMMARY_URL, {"start": 0}, None).status_code == 200
+    assert len(requests) == 3
+
+
+def test_fetch_stats_page_returns_rows_and_total(stats_api):
+    responses, requests = stats_api
+    responses.append(httpx.Response(200, json={"data": [{"playerId": 8478402}], "total": 1}))
+
+    rows, total = nhl_stats_api._fetch_stats_page("skater/summary", {"limit": 100, "start": 0})
+
+    assert rows == [{"playerId": 8478402}]
+    assert total == 1
+    assert requests[0].url.params["limit"] == "100"
+
+
+def test_fetch_stats_page_raises_on_http_error(stats_api):
+    responses, _ = stats_api
+    responses.append(httpx.Response(404))
+
+    with pytest.raises(nhl_stats_api.StatsFetchError):
+        nhl_stats_api._fetch_stats_page("skater/summary", {"start": 0})